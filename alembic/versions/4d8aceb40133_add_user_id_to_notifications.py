@@ -18,11 +18,34 @@ depends_on = None
 
 def upgrade() -> None:
     op.add_column('notifications', sa.Column('user_id', sa.Integer(), nullable=True))
-    op.create_foreign_key('fk_notifications_user_id', 'notifications', 'users', ['user_id'], ['id'], ondelete='CASCADE')
-    op.create_index('ix_notifications_user_id', 'notifications', ['user_id'])
+    # Add the FK as NOT VALID (catalog-only, no scan under the exclusive lock),
+    # then validate it separately: VALIDATE only takes SHARE UPDATE EXCLUSIVE,
+    # so writes to notifications continue while existing rows are checked.
+    op.execute(sa.text(
+        "ALTER TABLE notifications ADD CONSTRAINT fk_notifications_user_id "
+        "FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE NOT VALID"
+    ))
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(
+            "ALTER TABLE notifications VALIDATE CONSTRAINT fk_notifications_user_id"
+        ))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_user_id',
+            'notifications',
+            ['user_id'],
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('ix_notifications_user_id', table_name='notifications')
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_notifications_user_id',
+            table_name='notifications',
+            postgresql_concurrently=True,
+        )
     op.drop_constraint('fk_notifications_user_id', 'notifications', type_='foreignkey')
     op.drop_column('notifications', 'user_id')
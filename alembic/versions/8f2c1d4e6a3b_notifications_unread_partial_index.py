@@ -0,0 +1,50 @@
+"""Replace notifications (read, created_at) index with a partial covering index
+
+Revision ID: 8f2c1d4e6a3b
+Revises: f4a5b6c7d8e9
+Create Date: 2026-02-24 10:00:00.000000
+
+Changes:
+    1. Drop idx_notifications_read_created — most of its leaf pages hold
+       read = true rows that the unread badge/list queries never touch.
+    2. Drop ix_notifications_id — duplicates the primary key index.
+    3. Create ix_notifications_unread ON (user_id, created_at DESC)
+       INCLUDE (id, type, title, action_url) WHERE read = false, which
+       serves "unread for user X (or global), newest first" from the index.
+
+All index DDL runs CONCURRENTLY so polling clients are never blocked.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "8f2c1d4e6a3b"
+down_revision = "f4a5b6c7d8e9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_unread "
+            "ON notifications (user_id, created_at DESC) "
+            "INCLUDE (id, type, title, action_url) "
+            "WHERE read = false"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_notifications_read_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_notifications_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_id "
+            "ON notifications (id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_notifications_read_created "
+            "ON notifications (read, created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_notifications_unread")
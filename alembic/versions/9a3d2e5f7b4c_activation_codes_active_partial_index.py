@@ -0,0 +1,34 @@
+"""Partial index for active activation-code lookups
+
+Revision ID: 9a3d2e5f7b4c
+Revises: 8f2c1d4e6a3b
+Create Date: 2026-02-24 11:00:00.000000
+
+Backs WhitelistService.get_active_code:
+    WHERE whitelist_id = :id AND is_used = false AND expires_at > now()
+    ORDER BY expires_at DESC LIMIT 1
+Used codes never match, so they are left out of the index entirely.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "9a3d2e5f7b4c"
+down_revision = "8f2c1d4e6a3b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_activation_codes_active "
+            "ON activation_codes (whitelist_id, expires_at DESC) "
+            "WHERE is_used = false"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_activation_codes_active")
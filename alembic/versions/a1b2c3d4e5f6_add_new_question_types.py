@@ -32,13 +32,17 @@ NEW_VALUES = [
 
 
 def upgrade() -> None:
-    # ALTER TYPE ... ADD VALUE IF NOT EXISTS is safe in PostgreSQL 12+
-    # It cannot run inside a transaction when the type was just created,
-    # but for existing types it works fine in a regular transaction.
-    for value in NEW_VALUES:
-        op.execute(
-            sa.text(f"ALTER TYPE questiontype ADD VALUE IF NOT EXISTS '{value}'")
-        )
+    # ALTER TYPE ... ADD VALUE must commit before the new labels are usable,
+    # so run outside Alembic's transaction. All labels go in one round-trip;
+    # a multi-statement string is fine on PostgreSQL 12+ (README requires 14+).
+    # IF NOT EXISTS makes re-runs a no-op and keeps this on the cheap
+    # catalog-only path (no table rewrite).
+    statements = ";\n".join(
+        f"ALTER TYPE questiontype ADD VALUE IF NOT EXISTS '{value}'"
+        for value in NEW_VALUES
+    )
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(statements))
 
 
 def downgrade() -> None:
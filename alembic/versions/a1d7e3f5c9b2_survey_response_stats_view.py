@@ -0,0 +1,71 @@
+"""Materialized view for per-survey response totals
+
+Revision ID: a1d7e3f5c9b2
+Revises: f4c9d6a2b7e5
+Create Date: 2026-02-24 17:00:00.000000
+
+mv_survey_response_stats holds, per survey, the response count and the
+first/last completed_at, so /admin/responses/summary no longer aggregates
+every survey_responses row on each reports page load.
+
+Refresh:
+    - If the pg_cron extension is installed, a job refreshes the view every
+      minute (REFRESH ... CONCURRENTLY, readers are never blocked).
+    - Otherwise app.core.matviews refreshes it from a background task on the
+      same interval. Requests never refresh it.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a1d7e3f5c9b2"
+down_revision = "f4c9d6a2b7e5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Created WITH DATA: REFRESH ... CONCURRENTLY refuses an unpopulated view
+    op.execute(sa.text("""
+        CREATE MATERIALIZED VIEW mv_survey_response_stats AS
+        SELECT v.survey_id,
+               count(*) AS total_responses,
+               min(sr.completed_at) AS first_response_at,
+               max(sr.completed_at) AS last_response_at
+        FROM survey_responses sr
+        JOIN survey_versions v ON v.id = sr.version_id
+        GROUP BY v.survey_id
+    """))
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(sa.text(
+        "CREATE UNIQUE INDEX ux_mv_survey_response_stats "
+        "ON mv_survey_response_stats (survey_id)"
+    ))
+    op.execute(sa.text("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.schedule(
+                    'refresh-survey-response-stats',
+                    '* * * * *',
+                    'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_survey_response_stats'
+                );
+            END IF;
+        END
+        $$
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule(jobid)
+                FROM cron.job WHERE jobname = 'refresh-survey-response-stats';
+            END IF;
+        END
+        $$
+    """))
+    op.execute(sa.text("DROP MATERIALIZED VIEW IF EXISTS mv_survey_response_stats"))
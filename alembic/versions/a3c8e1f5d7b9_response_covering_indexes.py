@@ -0,0 +1,99 @@
+"""Covering composites on survey_responses / question_answers
+
+Revision ID: a3c8e1f5d7b9
+Revises: f6b3d8a2c4e7
+Create Date: 2026-02-26 11:00:00.000000
+
+c5d6e7f8a9b0 built the response composites as plain key indexes and left
+the single-column indexes they make redundant. This migration:
+    - rebuilds ix_survey_responses_version_completed as
+      (version_id, completed_at DESC) INCLUDE (user_id, id), so the summary
+      and export counts run as index-only scans;
+    - rebuilds ix_question_answers_response_question with INCLUDE (id);
+    - drops ix_survey_responses_user_id (left prefix of
+      ix_survey_responses_user_completed_id, from b9e2c4a7d1f3) and
+      ix_question_answers_response_id (left prefix of the composite above).
+
+Each replacement is built under a temporary name before the old index is
+dropped and the new one renamed, so the table is never without it.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a3c8e1f5d7b9"
+down_revision = "f6b3d8a2c4e7"
+branch_labels = None
+depends_on = None
+
+
+def _swap_index(name: str, table: str, columns, include=None) -> None:
+    """Build `name` under a temporary name, drop the old one, then rename."""
+    op.create_index(
+        f"{name}_new",
+        table,
+        columns,
+        postgresql_include=include or [],
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    op.execute(f"ALTER INDEX IF EXISTS {name}_new RENAME TO {name}")
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        _swap_index(
+            "ix_survey_responses_version_completed",
+            "survey_responses",
+            ["version_id", sa.text("completed_at DESC")],
+            include=["user_id", "id"],
+        )
+        _swap_index(
+            "ix_question_answers_response_question",
+            "question_answers",
+            ["response_id", "question_id"],
+            include=["id"],
+        )
+        op.drop_index(
+            "ix_survey_responses_user_id",
+            table_name="survey_responses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_question_answers_response_id",
+            table_name="question_answers",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_question_answers_response_id",
+            "question_answers",
+            ["response_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_survey_responses_user_id",
+            "survey_responses",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        _swap_index(
+            "ix_question_answers_response_question",
+            "question_answers",
+            ["response_id", "question_id"],
+        )
+        _swap_index(
+            "ix_survey_responses_version_completed",
+            "survey_responses",
+            ["version_id", "completed_at"],
+        )
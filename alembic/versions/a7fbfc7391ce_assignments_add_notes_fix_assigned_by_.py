@@ -1,7 +1,7 @@
 """assignments_add_notes_fix_assigned_by_fk_drop_unique
 
 Revision ID: a7fbfc7391ce
-Revises: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
 Create Date: 2026-02-17 21:59:18.383254
 
 """
@@ -11,7 +11,7 @@ from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision = 'a7fbfc7391ce'
-down_revision = 'd4e5f6a7b8c9'
+down_revision = 'c3d4e5f6a7b8'
 branch_labels = None
 depends_on = None
 
@@ -26,15 +26,30 @@ def upgrade() -> None:
                existing_type=sa.INTEGER(),
                nullable=True)
     op.drop_constraint('uq_user_survey', 'assignments', type_='unique')
-    op.create_index(op.f('ix_assignments_assigned_by'), 'assignments', ['assigned_by'], unique=False)
     op.create_foreign_key(None, 'assignments', 'users', ['assigned_by'], ['id'], ondelete='SET NULL')
     # ### end Alembic commands ###
 
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_assignments_assigned_by'),
+            'assignments',
+            ['assigned_by'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
 
 def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_assignments_assigned_by'),
+            table_name='assignments',
+            postgresql_concurrently=True,
+        )
+
     # ### commands auto generated by Alembic - please adjust! ###
     op.drop_constraint(None, 'assignments', type_='foreignkey')
-    op.drop_index(op.f('ix_assignments_assigned_by'), table_name='assignments')
     op.create_unique_constraint('uq_user_survey', 'assignments', ['user_id', 'survey_id'])
     op.alter_column('assignments', 'assigned_by',
                existing_type=sa.INTEGER(),
@@ -0,0 +1,111 @@
+"""Documents indexes for the pending workflow
+
+Revision ID: b4d9f2a6c8e3
+Revises: a3c8e1f5d7b9
+Create Date: 2026-02-26 12:00:00.000000
+
+f4a5b6c7d8e9 gave documents one single-column btree per filtered column.
+This migration:
+    - adds ix_documents_user_status_created (user_id, status, created_at DESC)
+      for the per-user "my documents" list and the pending-documents count
+      polled by /mobile/sync-status;
+    - adds ix_documents_pending (created_at DESC) WHERE status = 'pending'
+      for the review queue, without indexing the uploaded/error majority;
+    - replaces the unique ix_documents_document_id index with the UNIQUE
+      constraint documents_document_id_key the model declares (its index is
+      built concurrently first, so uniqueness is enforced throughout);
+    - drops ix_documents_user_id / ix_documents_status (covered by the
+      composite above).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b4d9f2a6c8e3"
+down_revision = "a3c8e1f5d7b9"
+branch_labels = None
+depends_on = None
+
+_REPLACED_INDEXES = (
+    ("ix_documents_user_id", "user_id"),
+    ("ix_documents_status", "status"),
+)
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_documents_user_status_created",
+            "documents",
+            ["user_id", "status", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_pending "
+            "ON documents (created_at DESC) WHERE status = 'pending'"
+        )
+        op.create_index(
+            "documents_document_id_key",
+            "documents",
+            ["document_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, _ in _REPLACED_INDEXES:
+            op.drop_index(
+                name,
+                table_name="documents",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    # Attaching a ready index only takes a brief lock (no table scan)
+    op.execute(
+        "ALTER TABLE documents ADD CONSTRAINT documents_document_id_key "
+        "UNIQUE USING INDEX documents_document_id_key"
+    )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_documents_document_id",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_documents_document_id",
+            "documents",
+            ["document_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_constraint("documents_document_id_key", "documents", type_="unique")
+    with op.get_context().autocommit_block():
+        for name, column in _REPLACED_INDEXES:
+            op.create_index(
+                name,
+                "documents",
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index(
+            "ix_documents_pending",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_documents_user_status_created",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,42 @@
+"""Keyset index for whitelist pagination
+
+Revision ID: b6e4f1a2c8d7
+Revises: 9a3d2e5f7b4c
+Create Date: 2026-02-24 12:00:00.000000
+
+Backs WhitelistService.list_whitelist_entries default ordering:
+    WHERE (created_at, id) < (:cursor_ts, :cursor_id)
+    ORDER BY created_at DESC, id DESC LIMIT :limit
+so each page is an index range scan that stops after :limit rows.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b6e4f1a2c8d7"
+down_revision = "9a3d2e5f7b4c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_whitelist_created_id",
+            "user_whitelist",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_whitelist_created_id",
+            table_name="user_whitelist",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,56 @@
+"""survey_responses (user_id, completed_at DESC, id DESC) keyset index
+
+Revision ID: b9e2c4a7d1f3
+Revises: a1d7e3f5c9b2
+Create Date: 2026-02-25 09:00:00.000000
+
+Per-user response lists (/mobile/responses/me, /assignments/my-team-responses)
+page by (completed_at, id) keyset. ix_survey_responses_user_completed only
+carried id as an INCLUDE column, so ties on completed_at still needed a sort
+step. ix_survey_responses_user_completed_id moves id into the key and
+replaces it; per-user counts stay index-only.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b9e2c4a7d1f3"
+down_revision = "a1d7e3f5c9b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_survey_responses_user_completed_id",
+            "survey_responses",
+            ["user_id", sa.text("completed_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_survey_responses_user_completed",
+            table_name="survey_responses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_survey_responses_user_completed",
+            "survey_responses",
+            ["user_id", sa.text("completed_at DESC")],
+            postgresql_include=["id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_survey_responses_user_completed_id",
+            table_name="survey_responses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
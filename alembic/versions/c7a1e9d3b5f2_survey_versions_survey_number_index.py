@@ -0,0 +1,44 @@
+"""survey_versions (survey_id, version_number DESC) covering index
+
+Revision ID: c7a1e9d3b5f2
+Revises: b9e2c4a7d1f3
+Create Date: 2026-02-25 11:00:00.000000
+
+survey_versions had no index on survey_id, so every "latest published
+version" lookup (the DISTINCT ON in get_latest_published_version_ids and the
+LATERAL in the /mobile/surveys fingerprint, both on each mobile poll)
+scanned the table. ix_survey_versions_survey_number walks each survey's
+versions newest first; INCLUDE (id, is_published) answers both lookups
+from the index alone. It also serves the survey_id foreign key.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c7a1e9d3b5f2"
+down_revision = "b9e2c4a7d1f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_survey_versions_survey_number",
+            "survey_versions",
+            ["survey_id", sa.text("version_number DESC")],
+            postgresql_include=["id", "is_published"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_survey_versions_survey_number",
+            table_name="survey_versions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,74 @@
+"""Materialized view for activation audit statistics
+
+Revision ID: c8f5a3d9e2b1
+Revises: b6e4f1a2c8d7
+Create Date: 2026-02-24 13:00:00.000000
+
+mv_activation_stats pre-aggregates activation_audit_log per
+(event_type, failure_reason, hour) so /admin/activation-audit/stats reads a
+few hundred rows instead of scanning the whole log on every request.
+
+Refresh:
+    - If the pg_cron extension is installed, a job refreshes the view every
+      5 minutes (REFRESH ... CONCURRENTLY, readers are never blocked).
+    - Otherwise app.core.matviews refreshes it from a background task on the
+      same interval. Requests never refresh it.
+
+failure_reason is stored as coalesce(failure_reason, '') so the unique index
+that REFRESH ... CONCURRENTLY needs never contains NULLs ('' = no reason).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c8f5a3d9e2b1"
+down_revision = "b6e4f1a2c8d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Created WITH DATA: REFRESH ... CONCURRENTLY refuses an unpopulated view
+    op.execute(sa.text("""
+        CREATE MATERIALIZED VIEW mv_activation_stats AS
+        SELECT event_type,
+               coalesce(failure_reason, '') AS failure_reason,
+               date_trunc('hour', created_at) AS bucket,
+               count(*) FILTER (WHERE success) AS ok,
+               count(*) AS total
+        FROM activation_audit_log
+        GROUP BY event_type, coalesce(failure_reason, ''), date_trunc('hour', created_at)
+    """))
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(sa.text(
+        "CREATE UNIQUE INDEX ux_mv_activation_stats "
+        "ON mv_activation_stats (event_type, failure_reason, bucket)"
+    ))
+    op.execute(sa.text("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.schedule(
+                    'refresh-activation-stats',
+                    '*/5 * * * *',
+                    'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_activation_stats'
+                );
+            END IF;
+        END
+        $$
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule(jobid)
+                FROM cron.job WHERE jobname = 'refresh-activation-stats';
+            END IF;
+        END
+        $$
+    """))
+    op.execute(sa.text("DROP MATERIALIZED VIEW IF EXISTS mv_activation_stats"))
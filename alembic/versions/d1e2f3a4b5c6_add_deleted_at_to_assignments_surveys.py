@@ -18,32 +18,45 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # assignments.deleted_at
+    # assignments.deleted_at / surveys.deleted_at (nullable, no default: catalog-only change)
     op.add_column(
         "assignments",
         sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
     )
-    op.create_index(
-        "ix_assignments_deleted_at",
-        "assignments",
-        ["deleted_at"],
-    )
-
-    # surveys.deleted_at
     op.add_column(
         "surveys",
         sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
     )
-    op.create_index(
-        "ix_surveys_deleted_at",
-        "surveys",
-        ["deleted_at"],
-    )
+
+    # Build the indexes without holding a write lock on the existing tables.
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_assignments_deleted_at",
+            "assignments",
+            ["deleted_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_surveys_deleted_at",
+            "surveys",
+            ["deleted_at"],
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index("ix_surveys_deleted_at", table_name="surveys")
-    op.drop_column("surveys", "deleted_at")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_surveys_deleted_at",
+            table_name="surveys",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_assignments_deleted_at",
+            table_name="assignments",
+            postgresql_concurrently=True,
+        )
 
-    op.drop_index("ix_assignments_deleted_at", table_name="assignments")
+    op.drop_column("surveys", "deleted_at")
     op.drop_column("assignments", "deleted_at")
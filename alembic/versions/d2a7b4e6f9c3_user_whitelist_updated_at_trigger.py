@@ -0,0 +1,41 @@
+"""Maintain user_whitelist.updated_at in the database
+
+Revision ID: d2a7b4e6f9c3
+Revises: c8f5a3d9e2b1
+Create Date: 2026-02-24 14:00:00.000000
+
+The ORM's onupdate only fires for unit-of-work flushes; bulk
+query().update() calls and manual SQL leave updated_at stale. The admin
+whitelist list derives its ETag from max(updated_at), so stamp it with a
+BEFORE UPDATE trigger instead of relying on the application.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d2a7b4e6f9c3"
+down_revision = "c8f5a3d9e2b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """))
+    op.execute(sa.text("""
+        CREATE TRIGGER trg_user_whitelist_updated_at
+        BEFORE UPDATE ON user_whitelist
+        FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP TRIGGER IF EXISTS trg_user_whitelist_updated_at ON user_whitelist"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS set_updated_at()"))
@@ -1,36 +0,0 @@
-"""create notifications table
-
-Revision ID: d4e5f6a7b8c9
-Revises: c3d4e5f6a7b8
-Create Date: 2026-02-17
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-revision: str = 'd4e5f6a7b8c9'
-down_revision: Union[str, None] = 'c3d4e5f6a7b8'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    op.create_table(
-        'notifications',
-        sa.Column('id', sa.Integer(), primary_key=True, index=True),
-        sa.Column('type', sa.String(50), nullable=False),
-        sa.Column('title', sa.String(255), nullable=False),
-        sa.Column('message', sa.Text(), nullable=False),
-        sa.Column('read', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('action_url', sa.String(255), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-    )
-    # Index for fast unread-count polling
-    op.create_index('idx_notifications_read_created', 'notifications', ['read', sa.text('created_at DESC')])
-
-
-def downgrade() -> None:
-    op.drop_index('idx_notifications_read_created', table_name='notifications')
-    op.drop_table('notifications')
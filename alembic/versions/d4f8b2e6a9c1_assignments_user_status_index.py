@@ -0,0 +1,53 @@
+"""assignments (user_id, status) index
+
+Revision ID: d4f8b2e6a9c1
+Revises: c7a1e9d3b5f2
+Create Date: 2026-02-25 13:00:00.000000
+
+/mobile/surveys?status_filter=... filters a user's assignments by status
+in SQL. ix_assignments_user_status serves that predicate from the index.
+It replaces the single-column ix_assignments_user_id, whose lookups (and
+the users FK cascade) it covers as its left prefix.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d4f8b2e6a9c1"
+down_revision = "c7a1e9d3b5f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_assignments_user_status",
+            "assignments",
+            ["user_id", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_assignments_user_id",
+            table_name="assignments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_assignments_user_id",
+            "assignments",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_assignments_user_status",
+            table_name="assignments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
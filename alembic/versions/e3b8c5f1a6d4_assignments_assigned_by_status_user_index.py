@@ -0,0 +1,54 @@
+"""Covering index for encargado team lookups
+
+Revision ID: e3b8c5f1a6d4
+Revises: d2a7b4e6f9c3
+Create Date: 2026-02-24 15:00:00.000000
+
+ix_assignments_assigned_by_status_user (assigned_by, status, user_id) lets
+AssignmentRepository.get_team_members resolve
+    SELECT user_id FROM assignments WHERE assigned_by = :me AND status = 'active'
+from the index. It supersedes the single-column ix_assignments_assigned_by,
+which is its left prefix.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e3b8c5f1a6d4"
+down_revision = "d2a7b4e6f9c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_assignments_assigned_by_status_user",
+            "assignments",
+            ["assigned_by", "status", "user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_assignments_assigned_by",
+            table_name="assignments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_assignments_assigned_by",
+            "assignments",
+            ["assigned_by"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_assignments_assigned_by_status_user",
+            table_name="assignments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,47 @@
+"""survey_responses (user_id, synced_at DESC) index
+
+Revision ID: e5a9c3f7b1d8
+Revises: d4f8b2e6a9c1
+Create Date: 2026-02-25 15:00:00.000000
+
+/mobile/sync-status reads MAX(synced_at) for the user on every one-minute
+poll. No index carried synced_at, so that meant visiting every one of
+the user's responses. ix_survey_responses_user_synced turns it into a
+single-entry index lookup.
+
+The pending-documents counter on the same endpoint is served by
+ix_documents_user_status_created (user_id, status, created_at DESC), built
+by the later migration b4d9f2a6c8e3. Its (user_id, status) prefix makes the
+count a single range seek, so no separate partial index on
+documents (user_id) WHERE status = 'pending' is added.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5a9c3f7b1d8"
+down_revision = "d4f8b2e6a9c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_survey_responses_user_synced",
+            "survey_responses",
+            ["user_id", sa.text("synced_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_survey_responses_user_synced",
+            table_name="survey_responses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
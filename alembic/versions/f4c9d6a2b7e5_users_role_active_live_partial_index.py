@@ -0,0 +1,52 @@
+"""Partial (role, is_active) index over live users
+
+Revision ID: f4c9d6a2b7e5
+Revises: e3b8c5f1a6d4
+Create Date: 2026-02-24 16:00:00.000000
+
+Every role/is_active lookup (UserRepository.get_all / count_all, the admin
+dashboard counters) also filters deleted_at IS NULL, so the full
+ix_users_role_is_active carries soft-deleted rows no query reads.
+ix_users_role_active_live replaces it with the same key restricted to live
+accounts.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f4c9d6a2b7e5"
+down_revision = "e3b8c5f1a6d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_role_active_live "
+            "ON users (role, is_active) "
+            "WHERE deleted_at IS NULL"
+        )
+        op.drop_index(
+            "ix_users_role_is_active",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_role_is_active",
+            "users",
+            ["role", "is_active"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_users_role_active_live",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,186 @@
+"""Range-partition admin_audit_log by month with pg_partman
+
+Revision ID: f6b3d8a2c4e7
+Revises: e5a9c3f7b1d8
+Create Date: 2026-02-26 10:00:00.000000
+
+admin_audit_log is append-only and only ever pruned by age. As a plain
+table, retention means DELETE + VACUUM over the whole log. Partitioned by
+month on created_at, retention becomes dropping the oldest partitions.
+
+Steps (one transaction, the log is locked while rows are copied):
+    1. Rename the existing table to admin_audit_log_old.
+    2. Create admin_audit_log PARTITION BY RANGE (created_at). The partition
+       key must be part of the primary key, so it is (id, created_at). id keeps
+       drawing from admin_audit_log_id_seq and stays unique on its own.
+    3. partman.create_parent registers the table and creates every child
+       partition (monthly, from the oldest row's month, 3 months ahead, plus
+       the default partition). No partition is created by hand.
+    4. Copy the rows, drop the old table and rebuild the indexes on the parent.
+
+Requires the pg_partman extension. If pg_cron is installed, a job runs
+partman's maintenance hourly so future months exist before they are needed.
+Otherwise enable pg_partman_bgw. Retention is off until
+partman.part_config.retention is set for public.admin_audit_log.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "f6b3d8a2c4e7"
+down_revision = "e5a9c3f7b1d8"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = "id, actor_id, action, target_type, target_id, details, created_at"
+
+
+def _audit_log_columns():
+    return [
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('admin_audit_log_id_seq'::regclass)"),
+            nullable=False,
+        ),
+        sa.Column(
+            "actor_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("action", sa.String(80), nullable=False),
+        sa.Column("target_type", sa.String(40), nullable=True),
+        sa.Column("target_id", sa.Integer(), nullable=True),
+        sa.Column("details", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def _create_audit_log_indexes() -> None:
+    op.create_index("ix_admin_audit_log_id", "admin_audit_log", ["id"])
+    op.create_index("ix_admin_audit_log_actor_id", "admin_audit_log", ["actor_id"])
+    op.create_index("ix_admin_audit_log_action", "admin_audit_log", ["action"])
+    op.create_index("ix_admin_audit_log_target_id", "admin_audit_log", ["target_id"])
+    op.create_index(
+        "ix_admin_audit_log_created_brin",
+        "admin_audit_log",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index(
+        "ix_admin_audit_log_details_gin",
+        "admin_audit_log",
+        ["details"],
+        postgresql_using="gin",
+        postgresql_ops={"details": "jsonb_path_ops"},
+    )
+
+
+def _swap_out_current_table() -> None:
+    """Rename admin_audit_log to admin_audit_log_old and free its names."""
+    op.rename_table("admin_audit_log", "admin_audit_log_old")
+    op.execute(sa.text(
+        "ALTER TABLE admin_audit_log_old "
+        "RENAME CONSTRAINT admin_audit_log_pkey TO admin_audit_log_old_pkey"
+    ))
+    # Keep the id sequence alive when the old table is dropped
+    op.execute(sa.text("ALTER SEQUENCE admin_audit_log_id_seq OWNED BY NONE"))
+
+
+def _finish_swap() -> None:
+    """Copy rows from admin_audit_log_old, drop it and re-own the sequence."""
+    op.execute(sa.text(
+        f"INSERT INTO admin_audit_log ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM admin_audit_log_old"
+    ))
+    # Dropping the old table also drops its indexes, so the names are free again
+    op.drop_table("admin_audit_log_old")
+    op.execute(sa.text("ALTER SEQUENCE admin_audit_log_id_seq OWNED BY admin_audit_log.id"))
+    _create_audit_log_indexes()
+
+
+def upgrade() -> None:
+    op.execute(sa.text("CREATE SCHEMA IF NOT EXISTS partman"))
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_partman SCHEMA partman"))
+
+    _swap_out_current_table()
+    op.create_table(
+        "admin_audit_log",
+        *_audit_log_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at", name="admin_audit_log_pkey"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    # Start at the oldest row's month so every copied row gets a real partition
+    op.execute(sa.text("""
+        DO $$
+        DECLARE
+            partman_major int;
+            first_month timestamptz;
+        BEGIN
+            SELECT split_part(extversion, '.', 1)::int INTO partman_major
+            FROM pg_extension WHERE extname = 'pg_partman';
+            SELECT date_trunc('month', coalesce(min(created_at), now())) INTO first_month
+            FROM admin_audit_log_old;
+            -- pg_partman 5 renamed the native partition type to 'range'
+            PERFORM partman.create_parent(
+                p_parent_table => 'public.admin_audit_log',
+                p_control => 'created_at',
+                p_type => CASE WHEN partman_major >= 5 THEN 'range' ELSE 'native' END,
+                p_interval => '1 month',
+                p_premake => 3,
+                p_start_partition => to_char(first_month, 'YYYY-MM-DD HH24:MI:SS')
+            );
+        END
+        $$
+    """))
+    _finish_swap()
+
+    op.execute(sa.text("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.schedule(
+                    'partman-maintenance',
+                    '0 * * * *',
+                    'CALL partman.run_maintenance_proc()'
+                );
+            END IF;
+        END
+        $$
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule(jobid)
+                FROM cron.job WHERE jobname = 'partman-maintenance';
+            END IF;
+        END
+        $$
+    """))
+    op.execute(sa.text(
+        "DELETE FROM partman.part_config WHERE parent_table = 'public.admin_audit_log'"
+    ))
+    op.execute(sa.text("DROP TABLE IF EXISTS partman.template_public_admin_audit_log"))
+
+    # The partitioned table becomes admin_audit_log_old; dropping it drops
+    # every partition with it
+    _swap_out_current_table()
+    op.create_table(
+        "admin_audit_log",
+        *_audit_log_columns(),
+        sa.PrimaryKeyConstraint("id", name="admin_audit_log_pkey"),
+    )
+    _finish_swap()
@@ -1,11 +1,12 @@
 """Admin Whitelist and Activation Code Endpoints"""
 from typing import Annotated, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query, Request, Body
+from fastapi import APIRouter, Depends, Query, Request, Response, Body
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.api.dependencies import AdminUser
+from app.api.http_cache import check_not_modified, query_fingerprint_tag
 from app.services.whitelist_service import WhitelistService
 from app.services.activation_service import ActivationCodeService
 from app.schemas.activation import (
@@ -44,29 +45,13 @@ def create_whitelist_entry(
     service = WhitelistService(db)
     entry = service.create_whitelist_entry(data, current_user.id)
     
-    # Convert to response format
-    return WhitelistResponse(
-        id=entry.id,
-        identifier=entry.identifier,
-        identifier_type=entry.identifier_type,
-        full_name=entry.full_name,
-        phone=entry.phone,
-        assigned_role=entry.assigned_role,
-        assigned_supervisor={
-            "id": entry.assigned_supervisor.id,
-            "name": entry.assigned_supervisor.full_name
-        } if entry.assigned_supervisor else None,
-        is_activated=entry.is_activated,
-        has_active_code=False,
-        activated_at=entry.activated_at,
-        created_at=entry.created_at,
-        created_by_name=current_user.full_name,
-        notes=entry.notes
-    )
+    return WhitelistResponse.from_entry(entry)
 
 
 @router.get("/whitelist", response_model=WhitelistListResponse)
 def list_whitelist_entries(
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
     current_user: AdminUser,
     page: int = Query(1, ge=1),
@@ -76,12 +61,25 @@ def list_whitelist_entries(
     search: Optional[str] = Query(None, max_length=255),
     supervisor_id: Optional[int] = None,
     sort_by: str = Query("created_at", regex="^(created_at|full_name|identifier)$"),
-    sort_order: str = Query("desc", regex="^(asc|desc)$")
+    sort_order: str = Query("desc", regex="^(asc|desc)$"),
+    cursor: Optional[str] = Query(None, max_length=512)
 ):
     """
     List whitelist entries with filtering and pagination (Admin only).
+
+    Pass ``pagination.next_cursor`` back as ``cursor`` to fetch the next page
+    without an OFFSET scan; ``page`` is ignored when a cursor is given.
+    Send the returned ETag as If-None-Match to get a 304 while nothing changed.
     """
     service = WhitelistService(db)
+    not_modified = check_not_modified(request, response, query_fingerprint_tag(request, service.get_list_fingerprint(
+        status=status,
+        role=role,
+        search=search,
+        supervisor_id=supervisor_id
+    )))
+    if not_modified:
+        return not_modified
     return service.list_whitelist_entries(
         page=page,
         limit=limit,
@@ -90,7 +88,8 @@ def list_whitelist_entries(
         search=search,
         supervisor_id=supervisor_id,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor
     )
 
 
@@ -112,36 +111,10 @@ def get_whitelist_entry(
             detail=f"Whitelist entry {whitelist_id} not found"
         )
     
-    # Check for active codes
-    has_active_code = False
-    code_expires_at = None
-    if entry.activation_codes:
-        for code in entry.activation_codes:
-            if not code.is_used and not code.is_expired and not code.is_locked:
-                has_active_code = True
-                code_expires_at = code.expires_at
-                break
+    # Check for active codes (single indexed lookup, no collection load)
+    active_code = service.get_active_code(whitelist_id)
     
-    return WhitelistResponse(
-        id=entry.id,
-        identifier=entry.identifier,
-        identifier_type=entry.identifier_type,
-        full_name=entry.full_name,
-        phone=entry.phone,
-        assigned_role=entry.assigned_role,
-        assigned_supervisor={
-            "id": entry.assigned_supervisor.id,
-            "name": entry.assigned_supervisor.full_name
-        } if entry.assigned_supervisor else None,
-        is_activated=entry.is_activated,
-        has_active_code=has_active_code,
-        code_expires_at=code_expires_at,
-        activated_at=entry.activated_at,
-        activated_user_name=entry.activated_user.full_name if entry.activated_user else None,
-        created_at=entry.created_at,
-        created_by_name=entry.creator.full_name,
-        notes=entry.notes
-    )
+    return WhitelistResponse.from_entry(entry, active_code)
 
 
 @router.patch("/whitelist/{whitelist_id}", response_model=WhitelistResponse)
@@ -155,24 +128,7 @@ def update_whitelist_entry(
     service = WhitelistService(db)
     entry = service.update_whitelist_entry(whitelist_id, data)
     
-    return WhitelistResponse(
-        id=entry.id,
-        identifier=entry.identifier,
-        identifier_type=entry.identifier_type,
-        full_name=entry.full_name,
-        phone=entry.phone,
-        assigned_role=entry.assigned_role,
-        assigned_supervisor={
-            "id": entry.assigned_supervisor.id,
-            "name": entry.assigned_supervisor.full_name
-        } if entry.assigned_supervisor else None,
-        is_activated=entry.is_activated,
-        has_active_code=False,
-        activated_at=entry.activated_at,
-        created_at=entry.created_at,
-        created_by_name=entry.creator.full_name,
-        notes=entry.notes
-    )
+    return WhitelistResponse.from_entry(entry)
 
 
 @router.delete("/whitelist/{whitelist_id}", status_code=204)
@@ -209,6 +165,8 @@ async def generate_activation_code(
 
 @router.get("/activation-codes", response_model=ActivationCodeListResponse)
 def list_activation_codes(
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
     current_user: AdminUser,
     page: int = Query(1, ge=1),
@@ -218,10 +176,16 @@ def list_activation_codes(
     sort_by: str = Query("generated_at", regex="^(generated_at|expires_at)$"),
     sort_order: str = Query("desc", regex="^(asc|desc)$")
 ):
-    """List activation codes with filtering (Admin only)"""
+    """List activation codes with filtering (Admin only). Honors If-None-Match."""
     service = ActivationCodeService(db)
     # Convert "all" to None for the service layer
     status_filter = None if status == "all" else status
+    not_modified = check_not_modified(request, response, query_fingerprint_tag(request, service.get_list_fingerprint(
+        status_filter=status_filter,
+        whitelist_id=whitelist_id
+    )))
+    if not_modified:
+        return not_modified
     return service.list_activation_codes(
         page=page,
         limit=limit,
@@ -1,11 +1,13 @@
 """Response analytics router (Admin)."""
-from typing import Annotated, List, Optional
+from typing import Annotated, Iterator, List, Optional
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import date
+from sqlalchemy import Date, cast, column, func, select, table
+from datetime import date, datetime, time, timedelta
+import orjson
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.services.response_service import ResponseService
 from app.schemas.response import SurveyResponseDetail
 from app.api.dependencies import AdminOrEncargado
@@ -14,6 +16,19 @@ from app.models.survey import Survey, SurveyVersion, Question
 
 router = APIRouter(prefix="/admin/responses", tags=["Admin - Responses"])
 
+# Rows fetched per server-side cursor round-trip when streaming an export
+EXPORT_BATCH_SIZE = 1000
+
+# Per-survey totals, pre-aggregated by migration a1d7e3f5c9b2 and refreshed
+# every minute by pg_cron or app.core.matviews
+mv_survey_response_stats = table(
+    "mv_survey_response_stats",
+    column("survey_id"),
+    column("total_responses"),
+    column("first_response_at"),
+    column("last_response_at"),
+)
+
 
 @router.get("/summary")
 def get_responses_summary(
@@ -26,62 +41,52 @@ def get_responses_summary(
     Get per-survey response counts for the reports page.
     Returns each survey with total responses, version count, and last response date.
     Optionally filter by date range (date_from / date_to).
+    Totals come from mv_survey_response_stats and may lag by up to a minute.
     """
-    query = (
-        db.query(
+    stats = mv_survey_response_stats.c
+    total = func.coalesce(stats.total_responses, 0)
+    stmt = (
+        select(
             Survey.id.label("survey_id"),
             Survey.title.label("survey_title"),
             Survey.is_active.label("is_active"),
-            func.count(SurveyResponse.id).label("total_responses"),
-            func.max(SurveyResponse.completed_at).label("last_response_at"),
+            total.label("total_responses"),
+            stats.last_response_at.label("last_response_at"),
         )
-        .outerjoin(SurveyVersion, SurveyVersion.survey_id == Survey.id)
-        .outerjoin(SurveyResponse, SurveyResponse.version_id == SurveyVersion.id)
+        .select_from(Survey)
+        .outerjoin(mv_survey_response_stats, stats.survey_id == Survey.id)
     )
 
+    # The dates select surveys, not responses: keep surveys whose first
+    # response is on/after date_from and whose last is on/before date_to,
+    # with their full totals. Half-open timestamp bounds, no date() casts.
     if date_from:
-        query = query.filter(
-            (SurveyResponse.completed_at == None) |  # noqa: E711
-            (func.date(SurveyResponse.completed_at) >= date_from)
+        stmt = stmt.where(
+            stats.first_response_at >= datetime.combine(date_from, time.min)
         )
     if date_to:
-        query = query.filter(
-            (SurveyResponse.completed_at == None) |  # noqa: E711
-            (func.date(SurveyResponse.completed_at) <= date_to)
+        stmt = stmt.where(
+            stats.last_response_at < datetime.combine(date_to, time.min) + timedelta(days=1)
         )
 
-    rows = (
-        query
-        .group_by(Survey.id, Survey.title, Survey.is_active)
-        .order_by(func.count(SurveyResponse.id).desc())
-        .all()
-    )
+    stmt = stmt.order_by(total.desc())
 
-    return [
-        {
-            "survey_id": r.survey_id,
-            "survey_title": r.survey_title,
-            "is_active": r.is_active,
-            "total_responses": r.total_responses,
-            "last_response_at": r.last_response_at.isoformat() if r.last_response_at else None,
-        }
-        for r in rows
-    ]
+    # Plain Core rows as mappings: no ORM entity machinery, and the labels
+    # are already the response keys. Returned as an ORJSONResponse so the rows
+    # skip jsonable_encoder; orjson encodes the datetimes itself.
+    return ORJSONResponse([dict(r) for r in db.execute(stmt).mappings()])
 
 
-@router.get("/survey/{survey_id}/export")
-def get_survey_responses_export(
-    survey_id: int,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: AdminOrEncargado,
-):
+def _export_rows(survey_id: int) -> Iterator[bytes]:
     """
-    Get all answers for a survey, enriched with question_text and question_type.
-    Used for detailed data-analysis export (one row per answer).
-    Returns: list of flat answer rows with survey/response/question context.
+    Yield the export as a JSON array, one answer row at a time.
+
+    Runs on its own session: the request's get_db session is closed before a
+    streamed body is sent. yield_per makes psycopg2 use a server-side cursor,
+    so only one batch of rows is held in memory at a time.
     """
-    rows = (
-        db.query(
+    stmt = (
+        select(
             Survey.id.label("survey_id"),
             Survey.title.label("survey_title"),
             SurveyResponse.id.label("response_id"),
@@ -102,31 +107,40 @@ def get_survey_responses_export(
         .join(SurveyResponse, SurveyResponse.version_id == SurveyVersion.id)
         .join(QuestionAnswer, QuestionAnswer.response_id == SurveyResponse.id)
         .join(Question, Question.id == QuestionAnswer.question_id)
-        .filter(Survey.id == survey_id)
-        .order_by(SurveyResponse.completed_at.desc(), Question.order.asc())
-        .all()
+        .where(Survey.id == survey_id)
+        .order_by(SurveyResponse.completed_at.desc(), SurveyResponse.id.desc(), Question.order.asc())
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
     )
 
-    return [
-        {
-            "survey_id": r.survey_id,
-            "survey_title": r.survey_title,
-            "response_id": r.response_id,
-            "user_id": r.user_id,
-            "client_id": r.client_id,
-            "completed_at": r.completed_at.isoformat() if r.completed_at else None,
-            "started_at": r.started_at.isoformat() if r.started_at else None,
-            "location": r.location,
-            "question_id": r.question_id,
-            "question_text": r.question_text,
-            "question_type": r.question_type,
-            "question_order": r.question_order,
-            "answer_value": r.answer_value,
-            "media_url": r.media_url,
-            "answered_at": r.answered_at.isoformat() if r.answered_at else None,
-        }
-        for r in rows
-    ]
+    db = SessionLocal()
+    try:
+        yield b"["
+        separator = b""
+        for r in db.execute(stmt).mappings():
+            # orjson renders datetimes (ISO 8601) and the question_type enum natively
+            yield separator + orjson.dumps(dict(r))
+            separator = b","
+        yield b"]"
+    finally:
+        db.close()
+
+
+@router.get("/survey/{survey_id}/export")
+def get_survey_responses_export(
+    survey_id: int,
+    current_user: AdminOrEncargado,
+):
+    """
+    Get all answers for a survey, enriched with question_text and question_type.
+    Used for detailed data-analysis export (one row per answer).
+    Returns: list of flat answer rows with survey/response/question context,
+    streamed as a JSON array in batches of EXPORT_BATCH_SIZE rows.
+    """
+    return StreamingResponse(
+        _export_rows(survey_id),
+        media_type="application/json",
+        headers={"X-Accel-Buffering": "no"},  # don't let nginx buffer the stream
+    )
 
 
 @router.get("/survey/{survey_id}/timeline")
@@ -139,22 +153,23 @@ def get_survey_responses_timeline(
     Get response counts grouped by date for a survey.
     Used for timeline chart on the reports page.
     """
-    rows = (
-        db.query(
-            func.date(SurveyResponse.completed_at).label("date"),
+    # Rows come off ix_survey_responses_version_completed; grouping on the
+    # truncated day (as a DATE) is a cheap hash aggregate over that scan
+    day = cast(func.date_trunc("day", SurveyResponse.completed_at), Date)
+    stmt = (
+        select(
+            day.label("date"),
             func.count(SurveyResponse.id).label("count"),
         )
+        .select_from(SurveyResponse)
         .join(SurveyVersion, SurveyVersion.id == SurveyResponse.version_id)
-        .filter(SurveyVersion.survey_id == survey_id)
-        .group_by(func.date(SurveyResponse.completed_at))
-        .order_by(func.date(SurveyResponse.completed_at).asc())
-        .all()
+        .where(SurveyVersion.survey_id == survey_id)
+        .group_by(day)
+        .order_by(day.asc())
     )
 
-    return [
-        {"date": str(r.date), "count": r.count}
-        for r in rows
-    ]
+    # orjson writes the DATE as "YYYY-MM-DD", the same as date.isoformat()
+    return ORJSONResponse([dict(r) for r in db.execute(stmt).mappings()])
 
 
 @router.get("/survey/{survey_id}", response_model=List[SurveyResponseDetail])
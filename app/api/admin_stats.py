@@ -1,8 +1,10 @@
 """Admin statistics endpoint."""
+from threading import Lock
+from time import monotonic
 from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Annotated
+from sqlalchemy import func, select, true
+from typing import Annotated, Dict, Tuple
 
 from app.core.database import get_db
 from app.api.dependencies import AdminUser
@@ -14,6 +16,12 @@ from app.core.ops_metrics import get_mobile_ops_metrics
 
 router = APIRouter(prefix="/admin/stats", tags=["admin-stats"])
 
+# Process-local TTL cache keyed by role, so dashboards polled by several
+# admins at once share one computation. Resets on process restart.
+_STATS_TTL_SECONDS = 30.0
+_STATS_LOCK = Lock()
+_STATS_CACHE: Dict[str, Tuple[float, dict]] = {}
+
 
 @router.get("")
 def get_admin_stats(
@@ -26,57 +34,76 @@ def get_admin_stats(
     # "private" ensures proxies don't share it across users.
     response.headers["Cache-Control"] = "private, max-age=60"
 
-    # Exclude soft-deleted users from all counts
-    live_users = db.query(User).filter(User.deleted_at == None)  # noqa: E711
-
-    total_users = live_users.count()
-
-    active_brigadistas = (
-        live_users
-        .filter(User.role == UserRole.BRIGADISTA.value, User.is_active == True)
-        .count()
-    )
-
-    active_surveys = (
-        db.query(func.count(Survey.id))
-        .filter(Survey.is_active == True)
-        .scalar()
-        or 0
-    )
-
-    total_assignments = db.query(func.count(Assignment.id)).scalar() or 0
-
-    completed_assignments = (
-        db.query(func.count(Assignment.id))
-        .filter(Assignment.status == AssignmentStatus.INACTIVE.value)
-        .scalar()
-        or 0
-    )
-
-    pending_assignments = (
-        db.query(func.count(Assignment.id))
-        .filter(Assignment.status == AssignmentStatus.ACTIVE.value)
-        .scalar()
-        or 0
+    key = current_user.role.value if hasattr(current_user.role, "value") else str(current_user.role)
+    with _STATS_LOCK:
+        cached = _STATS_CACHE.get(key)
+        if cached and monotonic() - cached[0] < _STATS_TTL_SECONDS:
+            return cached[1]
+
+    stats = _compute_admin_stats(db)
+    with _STATS_LOCK:
+        _STATS_CACHE[key] = (monotonic(), stats)
+    return stats
+
+
+def _compute_admin_stats(db: Session) -> dict:
+    """Run the dashboard aggregates (uncached)."""
+    # Every count in one round-trip: each table is aggregated once with
+    # FILTER clauses and the single-row subqueries are cross-joined.
+    users = (
+        select(
+            func.count().label("total_users"),
+            func.count().filter(
+                User.role == UserRole.BRIGADISTA.value, User.is_active == True
+            ).label("active_brigadistas"),
+        )
+        .where(User.deleted_at == None)  # Exclude soft-deleted users  # noqa: E711
+        .subquery()
     )
-
-    total_responses = db.query(func.count(SurveyResponse.id)).scalar() or 0
-
+    assignments = select(
+        func.count().label("total_assignments"),
+        func.count().filter(
+            Assignment.status == AssignmentStatus.INACTIVE.value
+        ).label("completed_assignments"),
+        func.count().filter(
+            Assignment.status == AssignmentStatus.ACTIVE.value
+        ).label("pending_assignments"),
+    ).subquery()
+
+    stats = db.execute(
+        select(
+            users.c.total_users,
+            users.c.active_brigadistas,
+            assignments.c.total_assignments,
+            assignments.c.completed_assignments,
+            assignments.c.pending_assignments,
+            select(func.count(Survey.id))
+            .where(Survey.is_active == True)
+            .scalar_subquery()
+            .label("active_surveys"),
+            select(func.count(SurveyResponse.id))
+            .scalar_subquery()
+            .label("total_responses"),
+        ).select_from(users).join(assignments, true())
+    ).one()
+
+    # completed/total come from the same scan of assignments; only the
+    # division is left to Python (numeric from SQL would arrive as Decimal)
     response_rate = (
-        round((completed_assignments / total_assignments) * 100, 1)
-        if total_assignments > 0
+        round((stats.completed_assignments / stats.total_assignments) * 100, 1)
+        if stats.total_assignments > 0
         else 0.0
     )
 
     return {
-        "totalUsers": total_users,
-        "activeSurveys": active_surveys,
-        "completedAssignments": completed_assignments,
-        "totalResponses": total_responses,
-        "pendingAssignments": pending_assignments,
-        "activeBrigadistas": active_brigadistas,
+        "totalUsers": stats.total_users,
+        "activeSurveys": stats.active_surveys,
+        "completedAssignments": stats.completed_assignments,
+        "totalResponses": stats.total_responses,
+        "pendingAssignments": stats.pending_assignments,
+        "activeBrigadistas": stats.active_brigadistas,
         "responseRate": response_rate,
-        "totalAssignments": total_assignments,
+        "totalAssignments": stats.total_assignments,
     }
 
 
@@ -9,6 +9,7 @@ from app.schemas.assignment import AssignmentCreate, AssignmentUpdate, Assignmen
 from app.models.assignment import AssignmentStatus
 from app.models.admin_audit_log import AdminAuditLog
 from app.api.dependencies import AdminOrEncargado, BrigadistaUser
+from app.api.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/assignments", tags=["Assignments"])
 
@@ -28,8 +29,9 @@ def list_assignments(
     repo = AssignmentRepository(db)
     assignments = repo.get_all(status=status, skip=skip, limit=limit)
     # Attach response_count to each assignment as a transient attribute
+    counts = repo.get_response_counts(assignments)
     for a in assignments:
-        a.response_count = repo.get_response_count(a.user_id, a.survey_id)
+        a.response_count = counts.get((a.user_id, a.survey_id), 0)
     return assignments
 
 
@@ -115,8 +117,9 @@ def get_my_created_assignments(
     from app.repositories.assignment_repository import AssignmentRepository
     repo = AssignmentRepository(db)
     assignments = repo.get_by_assigner(current_user.id, status=status, skip=skip, limit=limit)
+    counts = repo.get_response_counts(assignments)
     for a in assignments:
-        a.response_count = repo.get_response_count(a.user_id, a.survey_id)
+        a.response_count = counts.get((a.user_id, a.survey_id), 0)
     return assignments
 
 
@@ -132,14 +135,7 @@ def get_my_team(
     """
     from app.repositories.assignment_repository import AssignmentRepository
     repo = AssignmentRepository(db)
-    assignments = repo.get_by_assigner(current_user.id, limit=200)
-    seen_ids: set = set()
-    team: list = []
-    for a in assignments:
-        if a.user and a.user.id not in seen_ids:
-            seen_ids.add(a.user.id)
-            team.append(a.user)
-    return team
+    return repo.get_team_members(current_user.id)
 
 
 @router.get("/my-team-responses")
@@ -148,65 +144,91 @@ def get_my_team_responses(
     current_user: AdminOrEncargado,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=500),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page; replaces skip"),
 ):
     """
     Get survey responses submitted by team members assigned by the current encargado.
     Returns a paginated list ordered by most recent first.
+    Pass the returned next_cursor as `after` to page without OFFSET.
     """
     from app.repositories.assignment_repository import AssignmentRepository
+    from app.repositories.response_repository import ResponseRepository
     from app.models.response import SurveyResponse
-    from app.models.survey import SurveyVersion, Survey
+    from app.models.survey import SurveyVersion
     from app.models.user import User
-    from sqlalchemy.orm import joinedload
-    from sqlalchemy import func
+    from sqlalchemy.orm import load_only, selectinload
+    from sqlalchemy import func, tuple_
 
-    repo = AssignmentRepository(db)
-    assignments = repo.get_by_assigner(current_user.id, limit=200)
-    user_ids = list({a.user_id for a in assignments})
+    user_ids = AssignmentRepository(db).get_assigned_user_ids(current_user.id)
 
     if not user_ids:
-        return {"items": [], "total": 0, "skip": skip, "limit": limit, "has_more": False}
+        return {"items": [], "total": 0, "skip": skip, "limit": limit, "has_more": False, "next_cursor": None}
 
-    base_filter = (
-        db.query(SurveyResponse)
-        .join(SurveyVersion, SurveyResponse.version_id == SurveyVersion.id)
-        .join(Survey, SurveyVersion.survey_id == Survey.id)
-        .filter(SurveyResponse.user_id.in_(user_ids))
-    )
+    base_filter = db.query(SurveyResponse).filter(SurveyResponse.user_id.in_(user_ids))
 
     total = base_filter.with_entities(func.count(SurveyResponse.id)).scalar()
 
+    # Seek past the cursor instead of counting off `skip` rows
+    page_query = base_filter
+    if after:
+        last_completed_at, last_id = decode_cursor(after)
+        page_query = page_query.filter(
+            tuple_(SurveyResponse.completed_at, SurveyResponse.id) < tuple_(last_completed_at, last_id)
+        )
+
+    # Narrow response rows; version/survey and the brigadista's name come
+    # from small IN queries over this page instead of widening every row.
     rows = (
-        base_filter
+        page_query
         .options(
-            joinedload(SurveyResponse.version).joinedload(SurveyVersion.survey),
+            load_only(
+                SurveyResponse.id,
+                SurveyResponse.user_id,
+                SurveyResponse.version_id,
+                SurveyResponse.client_id,
+                SurveyResponse.completed_at,
+                SurveyResponse.location,
+            ),
+            selectinload(SurveyResponse.version).selectinload(SurveyVersion.survey),
+            selectinload(SurveyResponse.user).load_only(User.id, User.full_name),
         )
-        .order_by(SurveyResponse.completed_at.desc())
-        .offset(skip)
-        .limit(limit)
+        .order_by(SurveyResponse.completed_at.desc(), SurveyResponse.id.desc())
+        .offset(0 if after else skip)
+        .limit(limit + 1)
         .all()
     )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
-    # Fetch user names in one query
-    users = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()}
+    # Answer counts for the page in one grouped query (not a lazy load per row)
+    answer_counts = ResponseRepository(db).count_answers_by_response([r.id for r in rows])
 
     items = [
         {
             "id": r.id,
             "user_id": r.user_id,
-            "brigadista_name": users[r.user_id].full_name if r.user_id in users else "—",
+            "brigadista_name": r.user.full_name,
             "survey_title": r.version.survey.title if r.version and r.version.survey else "—",
             "survey_id": r.version.survey_id if r.version else None,
             "version_id": r.version_id,
             "client_id": r.client_id,
             "completed_at": r.completed_at.isoformat() if r.completed_at else None,
             "location": r.location,
-            "answer_count": len(r.answers) if hasattr(r, "answers") else 0,
+            "answer_count": answer_counts.get(r.id, 0),
         }
         for r in rows
     ]
 
-    return {"items": items, "total": total, "skip": skip, "limit": limit, "has_more": skip + limit < total}
+    next_cursor = encode_cursor(rows[-1].completed_at, rows[-1].id) if has_more else None
+
+    return {
+        "items": items,
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    }
 
 
 @router.patch("/{assignment_id}", response_model=AssignmentResponse)
@@ -232,23 +254,19 @@ def delete_assignment(
     """
     Delete assignment (Admin or Encargado).
     """
-    from app.repositories.assignment_repository import AssignmentRepository
-    repo = AssignmentRepository(db)
-    assignment = repo.get_by_id(assignment_id)  # capture before deletion
-
     service = AssignmentService(db)
-    service.delete_assignment(assignment_id)
-
-    if assignment:
-        db.add(AdminAuditLog(
-            actor_id=current_user.id,
-            action="assignment.delete",
-            target_type="assignment",
-            target_id=assignment_id,
-            details={
-                "user_id": assignment.user_id,
-                "survey_id": assignment.survey_id,
-                "status": assignment.status.value if hasattr(assignment.status, 'value') else str(assignment.status),
-            },
-        ))
-        db.commit()
+    user_id, survey_id, previous_status = service.delete_assignment(assignment_id)
+
+    # Same transaction as the soft-delete: one commit, and no delete without its audit row
+    db.add(AdminAuditLog(
+        actor_id=current_user.id,
+        action="assignment.delete",
+        target_type="assignment",
+        target_id=assignment_id,
+        details={
+            "user_id": user_id,
+            "survey_id": survey_id,
+            "status": previous_status.value if hasattr(previous_status, 'value') else str(previous_status),
+        },
+    ))
+    db.commit()
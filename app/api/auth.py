@@ -48,9 +48,7 @@ def logout(
     Logout current user.
     Increments token_version to invalidate all current refresh tokens.
     """
-    current_user.token_version = (current_user.token_version or 1) + 1
-    db.add(current_user)
-    db.commit()
+    UserRepository(db).rotate_token_version(current_user.id)
     return {"message": "Successfully logged out"}
 
 
@@ -85,31 +83,28 @@ def refresh_token(
             detail="Invalid refresh token",
         )
 
+    # Token rotation: verify version matches and increment it in one UPDATE
     repo = UserRepository(db)
-    user = repo.get_by_id(int(user_id))
-    if not user or not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found or inactive",
-        )
-
-    # Token rotation: verify version matches, then increment
-    if token_ver is not None and token_ver != user.token_version:
+    rotated = repo.rotate_token_version(int(user_id), expected_version=token_ver)
+    if rotated is None:
+        # Slow path only to pick the right error message
+        user = repo.get_by_id(int(user_id))
+        if not user or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found or inactive",
+            )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token has been revoked",
         )
-
-    # Increment version to invalidate this refresh token
-    user.token_version = (user.token_version or 1) + 1
-    db.add(user)
-    db.commit()
+    new_version, role = rotated
 
     access_token = create_access_token(
-        data={"sub": str(user.id), "role": user.role.value}
+        data={"sub": str(user_id), "role": role.value}
     )
     new_refresh_token = create_refresh_token(
-        data={"sub": str(user.id), "role": user.role.value, "ver": user.token_version},
+        data={"sub": str(user_id), "role": role.value, "ver": new_version},
         expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     return {"access_token": access_token, "refresh_token": new_refresh_token}
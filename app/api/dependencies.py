@@ -1,6 +1,10 @@
 """API dependencies for authentication and authorization."""
-from typing import Annotated
-from fastapi import Depends, HTTPException, status
+import hashlib
+from functools import lru_cache
+from threading import Lock
+from time import monotonic, time
+from typing import Annotated, Any, Awaitable, Callable, Dict, FrozenSet, Tuple
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
@@ -8,12 +12,47 @@ from app.core.database import get_db
 from app.core.security import decode_access_token
 from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
+from app.services.auth_service import AuthService
+from app.services.response_service import ResponseService
+from app.services.survey_service import SurveyService
 
 # Security scheme
 security = HTTPBearer()
 
+# Verified access-token payloads, keyed by a truncated SHA-256 of the token
+# (raw tokens are never kept). Entries live at most _TOKEN_CACHE_TTL_SECONDS
+# and never past the token's own exp.
+_TOKEN_CACHE_TTL_SECONDS = 30.0
+_TOKEN_CACHE_MAX_ENTRIES = 10_000
+_TOKEN_CACHE_LOCK = Lock()
+_TOKEN_CACHE: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _decode_access_token_cached(token: str) -> Dict[str, Any]:
+    """decode_access_token, skipping the signature check for recently seen tokens."""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = monotonic()
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(key)
+    if cached and now < cached[0]:
+        return cached[1]
+
+    payload = decode_access_token(token)  # raises 401 on bad/expired tokens
+
+    ttl = min(_TOKEN_CACHE_TTL_SECONDS, payload.get("exp", 0) - time())
+    if ttl > 0:
+        with _TOKEN_CACHE_LOCK:
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_ENTRIES:
+                for stale in [k for k, (expires, _) in _TOKEN_CACHE.items() if expires <= now]:
+                    del _TOKEN_CACHE[stale]
+                if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_ENTRIES:
+                    _TOKEN_CACHE.clear()
+            _TOKEN_CACHE[key] = (now + ttl, payload)
+    return payload
+
 
 def get_current_user(
+    request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[Session, Depends(get_db)]
 ) -> User:
@@ -22,11 +61,19 @@ def get_current_user(
     
     Extracts JWT from Bearer token, validates it, and retrieves user.
     
+    The user is memoized on request.state, so any later resolution within
+    the same request (e.g. a Depends(..., use_cache=False)) reuses it
+    instead of decoding and querying again.
+    
     Raises:
         HTTPException: If token invalid or user not found
     """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = _decode_access_token_cached(token)
     
     user_id = payload.get("sub")
     if user_id is None:
@@ -43,10 +90,30 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive"
         )
-    
+
+    # Per-user rate limits key on user_id (see app.core.limiter.user_or_ip_key)
+    request.state.user = user
+    request.state.user_id = user.id
     return user
 
 
+@lru_cache(maxsize=32)
+def _make_role_checker(allowed_roles: FrozenSet[UserRole]) -> Callable[..., Awaitable[User]]:
+    """One checker per role set, so equal require_role(...) calls share a dependency."""
+    denied_detail = f"Access denied. Required roles: {sorted(r.value for r in allowed_roles)}"
+
+    # async: no I/O here, so FastAPI runs it inline instead of via the threadpool
+    async def role_checker(current_user: Annotated[User, Depends(get_current_user)]) -> User:
+        if current_user.role not in allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=denied_detail
+            )
+        return current_user
+
+    return role_checker
+
+
 def require_role(*allowed_roles: UserRole):
     """
     Dependency factory for role-based access control.
@@ -60,17 +127,10 @@ def require_role(*allowed_roles: UserRole):
         *allowed_roles: Roles that are allowed to access the endpoint
     
     Returns:
-        Dependency function that checks user role
+        Dependency function that checks user role (the same function for the
+        same set of roles, so FastAPI caches it once per request)
     """
-    def role_checker(current_user: Annotated[User, Depends(get_current_user)]) -> User:
-        if current_user.role not in allowed_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required roles: {[r.value for r in allowed_roles]}"
-            )
-        return current_user
-    
-    return role_checker
+    return _make_role_checker(frozenset(allowed_roles))
 
 
 # Common role dependencies
@@ -80,3 +140,23 @@ BrigadistaUser = Annotated[User, Depends(require_role(UserRole.BRIGADISTA))]
 AdminOrEncargado = Annotated[User, Depends(require_role(UserRole.ADMIN, UserRole.ENCARGADO))]
 MobileUser = Annotated[User, Depends(require_role(UserRole.BRIGADISTA, UserRole.ENCARGADO))]
 AnyUser = Annotated[User, Depends(get_current_user)]
+
+
+# Request-scoped services. FastAPI caches each dependency per request, so a
+# handler (and any sub-dependency) asking for the same service shares one
+# instance bound to the request's session.
+def get_auth_service(db: Annotated[Session, Depends(get_db)]) -> AuthService:
+    return AuthService(db)
+
+
+def get_survey_service(db: Annotated[Session, Depends(get_db)]) -> SurveyService:
+    return SurveyService(db)
+
+
+def get_response_service(db: Annotated[Session, Depends(get_db)]) -> ResponseService:
+    return ResponseService(db)
+
+
+AuthSvc = Annotated[AuthService, Depends(get_auth_service)]
+SurveySvc = Annotated[SurveyService, Depends(get_survey_service)]
+ResponseSvc = Annotated[ResponseService, Depends(get_response_service)]
@@ -0,0 +1,27 @@
+"""Conditional GET helpers (weak ETags and 304s) shared by the routers."""
+import hashlib
+from typing import Any, Optional, Tuple
+
+from fastapi import Request, Response
+
+
+def query_fingerprint_tag(request: Request, fingerprint: Tuple[Any, ...]) -> str:
+    """
+    ETag value for a list fingerprint that also varies with the query string,
+    so each filter/page combination gets its own tag.
+    """
+    return hashlib.sha1(
+        f"{request.url.query}|{fingerprint!r}".encode()
+    ).hexdigest()[:20]
+
+
+def check_not_modified(request: Request, response: Response, tag: str) -> Optional[Response]:
+    """
+    Bare 304 when If-None-Match already names this tag, so the caller can skip
+    its query and serialization; otherwise sets the weak ETag on the response.
+    """
+    etag = f'W/"{tag}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
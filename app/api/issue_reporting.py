@@ -3,84 +3,108 @@ Issue reporting email service endpoints.
 
 Security:
   - Requires authentication (AnyUser).
-  - Rate-limited to 3 requests/minute per IP.
+  - Rate-limited to 3 requests/minute per user.
   - HTML-escapes all user-supplied text before embedding in the email body.
   - Recipient is server-side only (not user-controlled).
 """
+import asyncio
 import html
 import logging
 
-import resend
-from fastapi import APIRouter, HTTPException, Request
+import httpx
+from fastapi import APIRouter, BackgroundTasks, Request, status
 from pydantic import BaseModel
 
 from app.core.config import settings
-from app.core.limiter import limiter
+from app.core.http import resend_client
+from app.core.limiter import limiter, user_or_ip_key
 from app.api.dependencies import AnyUser
 
 logger = logging.getLogger(__name__)
 
-resend.api_key = settings.RESEND_API_KEY
-
 
 router = APIRouter(prefix="/api/email", tags=["email"])
 
+# Attempts for a queued send; waits 1s, 2s between tries
+SEND_ATTEMPTS = 3
+
+# Body markup, built once at import; fields are HTML-escaped before format()
+_ISSUE_REPORT_HTML = """
+<html>
+  <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <h2 style="color: #d32f2f;">Reporte de Problema</h2>
+    <p><strong>Asunto:</strong> {subject}</p>
+    <p><strong>Reportado por:</strong> {sender}</p>
+    <hr style="border: 1px solid #eee; margin: 20px 0;" />
+    <h3>Descripción:</h3>
+    <p style="white-space: pre-wrap; background: #f5f5f5; padding: 15px; border-radius: 4px;">{body}</p>
+  </body>
+</html>
+"""
+
 
 class IssueReportRequest(BaseModel):
     subject: str
     body: str
 
 
-@router.post("/send-issue-report")
-@limiter.limit("3/minute")
+async def _send_via_resend(subject: str, email_html: str, reply_to: str, user_id: int) -> None:
+    """
+    Deliver one issue report, retrying transient Resend failures with
+    backoff. Runs as a background task after the 202 has been sent, so
+    failures are logged rather than raised.
+    """
+    for attempt in range(1, SEND_ATTEMPTS + 1):
+        try:
+            response = await resend_client.post(
+                "/emails",
+                json={
+                    "from": settings.FROM_EMAIL,
+                    "to": settings.ISSUE_REPORT_RECIPIENT,
+                    "subject": subject,
+                    "html": email_html,
+                    "reply_to": reply_to,
+                },
+            )
+            response.raise_for_status()
+            return
+        except httpx.HTTPError:
+            if attempt == SEND_ATTEMPTS:
+                logger.exception("Failed to send issue-report email for user %s", user_id)
+                return
+            await asyncio.sleep(2 ** (attempt - 1))
+
+
+@router.post("/send-issue-report", status_code=status.HTTP_202_ACCEPTED)
+@limiter.limit("3/minute", key_func=user_or_ip_key)
 async def send_issue_report(
     request: Request,
     payload: IssueReportRequest,
     current_user: AnyUser,
+    background: BackgroundTasks,
 ):
     """
-    Send an issue report email via Resend.
+    Queue an issue report email via Resend.
 
     - **Authentication required** (Bearer token).
     - Sender identity is taken from the authenticated user — cannot be spoofed.
     - The recipient address is fixed on the server side.
+    - Responds 202 immediately; the email is sent after the response.
     """
-    safe_subject = html.escape(payload.subject)
-    safe_body = html.escape(payload.body)
-    sender_email = html.escape(current_user.email)
-
-    try:
-        email_html = f"""
-        <html>
-          <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <h2 style="color: #d32f2f;">Reporte de Problema</h2>
-            <p><strong>Asunto:</strong> {safe_subject}</p>
-            <p><strong>Reportado por:</strong> {sender_email}</p>
-            <hr style="border: 1px solid #eee; margin: 20px 0;" />
-            <h3>Descripción:</h3>
-            <p style="white-space: pre-wrap; background: #f5f5f5; padding: 15px; border-radius: 4px;">{safe_body}</p>
-          </body>
-        </html>
-        """
-
-        response = resend.Emails.send(
-            {
-                "from": settings.FROM_EMAIL,
-                "to": settings.ISSUE_REPORT_RECIPIENT,
-                "subject": f"[Brigada] {safe_subject}",
-                "html": email_html,
-                "reply_to": current_user.email,
-            }
-        )
-
-        return {
-            "message": "Email enviado exitosamente",
-            "id": response.get("id"),
-        }
-
-    except Exception:
-        logger.exception("Failed to send issue-report email for user %s", current_user.id)
-        raise HTTPException(
-            status_code=500,
-            detail="Error enviando el reporte. Intenta de nuevo más tarde.",
-        )
+    email_html = _ISSUE_REPORT_HTML.format(
+        subject=html.escape(payload.subject),
+        sender=html.escape(current_user.email),
+        body=html.escape(payload.body),
+    )
+    # The subject line is plain text, not HTML: strip line breaks instead of escaping
+    subject_line = " ".join(payload.subject.split())
+
+    background.add_task(
+        _send_via_resend,
+        f"[Brigada] {subject_line}",
+        email_html,
+        current_user.email,
+        current_user.id,
+    )
+
+    return {"message": "Reporte en cola para envío"}
@@ -1,16 +1,15 @@
 """Mobile app routers for offline-first survey application."""
-from typing import Annotated, List, Optional, Tuple
-from fastapi import APIRouter, Depends, Query, File, UploadFile, HTTPException, Request, status, Header
+from threading import Lock
+from typing import Annotated, Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, Query, File, UploadFile, HTTPException, Request, Response, status, Header
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, timezone
-import uuid
-import cloudinary
-import cloudinary.utils
+import secrets
 
 from app.core.database import get_db
 from app.core.limiter import limiter
+from app.core.storage import CLOUDINARY_UPLOAD_URLS, sign_upload_params
 from app.services.survey_service import SurveyService
-from app.services.response_service import ResponseService
 from app.services.notification_service import NotificationService
 from app.repositories.assignment_repository import AssignmentRepository
 from app.repositories.response_repository import ResponseRepository
@@ -23,21 +22,28 @@ from app.schemas.response import (
     PaginatedResponse,
     DocumentUploadRequest,
     DocumentUploadResponse,
+    BatchDocumentUploadRequest,
     DocumentConfirmRequest,
     DocumentConfirmResponse,
     SyncStatus
 )
+from app.models.assignment import AssignmentStatus
 from app.models.document import Document
 from app.schemas.notification import NotificationResponse, NotificationListResponse, UnreadCountResponse
 from app.schemas.user import LoginResponse, UserResponse
-from app.api.dependencies import BrigadistaUser, MobileUser, get_current_user
-from app.services.auth_service import AuthService
+from app.api.dependencies import AuthSvc, BrigadistaUser, MobileUser, ResponseSvc, SurveySvc, get_current_user
+from app.api.http_cache import check_not_modified
+from app.api.pagination import decode_cursor, encode_cursor
 from app.core.config import settings
-from pydantic import BaseModel as _BaseModel, EmailStr
+from pydantic import BaseModel as _BaseModel, EmailStr, TypeAdapter
 
 CURRENT_MOBILE_API_VERSION = "2026.1"
 MIN_SUPPORTED_MOBILE_API_VERSION = "2025.12"
 
+# Document types that go through OCR, and the confidence below which we warn
+_OCR_REQUIRED_TYPES = frozenset({"id_card", "form", "receipt"})
+_OCR_THRESHOLD = 0.7
+
 
 def _parse_mobile_version(raw: str) -> Tuple[int, int]:
     try:
@@ -79,6 +85,173 @@ router = APIRouter(
 )
 
 
+# Validated structures of published survey versions, keyed by version id.
+# Published versions are never edited (changing questions creates a new
+# version), so an entry can't go stale; the dict is only bounded in size.
+_VERSION_CACHE_MAX_ENTRIES = 256
+_VERSION_CACHE_LOCK = Lock()
+_VERSION_CACHE: Dict[int, SurveyVersionResponse] = {}
+
+
+# Serialized /mobile/surveys body per user with the fingerprint it was built
+# for. A hit needs the fingerprint (the ETag) to still match, so a client
+# without a cached ETag (fresh install, second device) gets bytes instead of
+# a rebuild. Bodies grow with the user's surveys, so the cache is bounded by
+# total bytes: the least recently stored entries are evicted first.
+_SURVEYS_PAYLOAD_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_SURVEYS_PAYLOAD_CACHE_LOCK = Lock()
+_SURVEYS_PAYLOAD_CACHE: Dict[int, Tuple[str, bytes]] = {}
+_surveys_payload_cache_bytes = 0
+_ASSIGNED_SURVEYS_ADAPTER = TypeAdapter(List[AssignedSurveyResponse])
+
+
+def _store_surveys_payload(user_id: int, fingerprint: str, body: bytes) -> None:
+    """Cache a user's body, evicting the oldest entries past the byte budget."""
+    global _surveys_payload_cache_bytes
+    if len(body) > _SURVEYS_PAYLOAD_CACHE_MAX_BYTES:
+        return
+    with _SURVEYS_PAYLOAD_CACHE_LOCK:
+        previous = _SURVEYS_PAYLOAD_CACHE.pop(user_id, None)
+        if previous:
+            _surveys_payload_cache_bytes -= len(previous[1])
+        while _SURVEYS_PAYLOAD_CACHE and (
+            _surveys_payload_cache_bytes + len(body) > _SURVEYS_PAYLOAD_CACHE_MAX_BYTES
+        ):
+            # dicts keep insertion order, so the first key is the oldest entry
+            _, evicted = _SURVEYS_PAYLOAD_CACHE.pop(next(iter(_SURVEYS_PAYLOAD_CACHE)))
+            _surveys_payload_cache_bytes -= len(evicted)
+        _SURVEYS_PAYLOAD_CACHE[user_id] = (fingerprint, body)
+        _surveys_payload_cache_bytes += len(body)
+
+
+def _get_version_structures(
+    survey_service: SurveyService, version_ids: List[int]
+) -> Dict[int, SurveyVersionResponse]:
+    """Cached SurveyVersionResponse per version id; misses load in one query."""
+    with _VERSION_CACHE_LOCK:
+        found = {vid: _VERSION_CACHE[vid] for vid in version_ids if vid in _VERSION_CACHE}
+    missing = [vid for vid in version_ids if vid not in found]
+    if missing:
+        loaded = {
+            v.id: SurveyVersionResponse.model_validate(v)
+            for v in survey_service.get_versions_with_questions(missing)
+        }
+        with _VERSION_CACHE_LOCK:
+            if len(_VERSION_CACHE) + len(loaded) > _VERSION_CACHE_MAX_ENTRIES:
+                _VERSION_CACHE.clear()
+            _VERSION_CACHE.update(loaded)
+        found.update(loaded)
+    return found
+
+
+def _resolve_document_survey_id(db: Session, client_id: str) -> str:
+    """Survey id for the Cloudinary folder, or "unknown" (the response may not exist yet)."""
+    try:
+        survey_id = ResponseRepository(db).get_survey_id_by_client_id(client_id)
+    except Exception:
+        return "unknown"  # Non-fatal — folder degrades gracefully to "unknown"
+    return str(survey_id) if survey_id is not None else "unknown"
+
+
+def _prepare_document_upload(
+    request: DocumentUploadRequest, user_id: int, survey_id: str, now_utc: datetime
+) -> Tuple[Document, DocumentUploadResponse]:
+    """Pending Document row plus the signed direct-upload params for it (no DB access)."""
+    # Check OCR confidence
+    ocr_confidence = request.metadata.ocr_confidence
+    ocr_required = request.metadata.document_type in _OCR_REQUIRED_TYPES
+    low_confidence_warning = (
+        ocr_required
+        and ocr_confidence is not None
+        and ocr_confidence < _OCR_THRESHOLD
+    )
+
+    # Generate unique document ID
+    document_id = f"doc_{secrets.token_hex(8)}"
+    expires_at = now_utc + timedelta(minutes=30)
+
+    # Determine Cloudinary resource_type
+    doc_type = (request.metadata.document_type if request.metadata else "photo").lower()
+    resource_type = "image" if request.mime_type.startswith("image/") else "raw"
+
+    # ── Smart folder hierarchy ─────────────────────────────────────────────
+    # brigada/surveys/{survey_id}/{year}/{month}/{doc_type}/q{question_id}/{doc_id}
+    #
+    # Enables Cloudinary prefix queries like:
+    #   brigada/surveys/7/**              → all files for survey 7
+    #   brigada/surveys/7/2026/02/**      → monthly slice
+    #   brigada/surveys/7/2026/02/photo/** → photos that month
+    #
+    year_str = now_utc.strftime("%Y")
+    month_str = now_utc.strftime("%m")
+    question_id = request.metadata.question_id if request.metadata else None
+    q_segment = f"q{question_id}" if question_id else "q-unknown"
+
+    folder = (
+        f"brigada/surveys/{survey_id}"
+        f"/{year_str}/{month_str}"
+        f"/{doc_type}"
+        f"/{q_segment}"
+    )
+    public_id = f"{folder}/{document_id}"
+
+    timestamp = int(now_utc.timestamp())
+    upload_params = {
+        "public_id": public_id,
+        "timestamp": timestamp,
+        "resource_type": resource_type,
+        "tags": [
+            f"survey_{survey_id}",
+            f"user_{user_id}",
+            f"type_{doc_type}",
+            f"year_{year_str}",
+            f"month_{year_str}_{month_str}",
+            *([f"question_{question_id}"] if question_id else []),
+            "brigada",
+        ],
+        # Store rich context as Cloudinary metadata (searchable in dashboard)
+        "context": "|".join([
+            f"survey_id={survey_id}",
+            f"user_id={user_id}",
+            f"doc_type={doc_type}",
+            f"client_id={request.client_id}",
+            *([f"question_id={question_id}"] if question_id else []),
+        ]),
+    }
+
+    # Generate Cloudinary signature
+    signature = sign_upload_params(upload_params)
+
+    # ── Document record (status = pending) ─────────────────────────────────
+    doc_record = Document(
+        document_id=document_id,
+        user_id=user_id,
+        response_client_id=request.client_id,
+        question_id=question_id,
+        file_name=request.file_name,
+        file_size=request.file_size,
+        mime_type=request.mime_type,
+        document_type=doc_type,
+        cloudinary_public_id=public_id,
+        ocr_confidence=ocr_confidence,
+        status="pending",
+    )
+
+    return doc_record, DocumentUploadResponse(
+        document_id=document_id,
+        upload_url=CLOUDINARY_UPLOAD_URLS[resource_type],
+        expires_at=expires_at,
+        ocr_required=ocr_required,
+        low_confidence_warning=low_confidence_warning,
+        # Extra signed params the mobile app needs for the direct upload
+        cloudinary_signature=signature,
+        cloudinary_timestamp=timestamp,
+        cloudinary_api_key=settings.CLOUDINARY_API_KEY,
+        cloudinary_public_id=public_id,
+        cloudinary_folder=folder,
+    )
+
+
 class MobileLoginRequest(_BaseModel):
     """Request body for mobile login."""
     email: str
@@ -101,7 +274,7 @@ def mobile_contract_info():
 def mobile_login(
     request: Request,
     body: MobileLoginRequest,
-    db: Annotated[Session, Depends(get_db)],
+    auth_service: AuthSvc,
 ):
     """
     Mobile-specific login endpoint.
@@ -114,8 +287,6 @@ def mobile_login(
     - Device ID for offline sync tracking
     - App version for compatibility checks
     """
-    auth_service = AuthService(db)
-    
     # Single authenticate + token generation (no double bcrypt)
     token = auth_service.login(body.email, body.password)
     
@@ -137,7 +308,10 @@ def get_my_profile(current_user: MobileUser):
 
 @router.get("/surveys", response_model=List[AssignedSurveyResponse])
 def get_assigned_surveys(
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
+    survey_service: SurveySvc,
     current_user: MobileUser,
     status_filter: str = Query(None, description="Filter by assignment status: active, inactive"),
 ):
@@ -153,6 +327,8 @@ def get_assigned_surveys(
     - Assignment metadata (ID, status, location)
     - Latest published survey version with all questions
     - Survey structure is immutable (mobile cannot modify)
+    - ETag header; send it back as If-None-Match to get a 304 while
+      nothing changed
     
     **Constraints:**
     - Only returns PUBLISHED survey versions
@@ -160,57 +336,68 @@ def get_assigned_surveys(
     - Version integrity is enforced
     """
     assignment_repo = AssignmentRepository(db)
-    survey_service = SurveyService(db)
-    
-    # Get user's assignments
-    assignments = assignment_repo.get_by_user(current_user.id)
     
     # Filter by status if provided
+    status_enum = None
     if status_filter:
-        from app.models.assignment import AssignmentStatus
         try:
             status_enum = AssignmentStatus(status_filter)
-            assignments = [a for a in assignments if a.status == status_enum]
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid status: {status_filter}"
             )
-    
-    # Build response with survey details and latest versions
-    # Batch-fetch all published versions in ONE query (avoids N+1)
-    survey_ids = list({a.survey_id for a in assignments})
-    versions_map = survey_service.get_latest_published_versions_batch(survey_ids)
 
-    result = []
-    for assignment in assignments:
-        latest_version = versions_map.get(assignment.survey_id)
-        if latest_version is None:
-            continue  # Skip surveys without published versions
+    # Everything the payload depends on besides the (immutable) version
+    # structures, hashed in SQL so an unchanged list costs one aggregate
+    # query and a 304, with no rows loaded
+    fingerprint = assignment_repo.get_user_fingerprint(current_user.id, status=status_enum)
+    not_modified = check_not_modified(request, response, fingerprint)
+    if not_modified:
+        return not_modified
+
+    with _SURVEYS_PAYLOAD_CACHE_LOCK:
+        cached = _SURVEYS_PAYLOAD_CACHE.get(current_user.id)
+    if cached and cached[0] == fingerprint:
+        return Response(content=cached[1], media_type="application/json", headers={"ETag": response.headers["ETag"]})
+
+    # User's assignments on active, non-deleted surveys (survey joined in)
+    assignments = assignment_repo.get_by_user(
+        current_user.id, status=status_enum, live_surveys_only=True
+    )
 
-        # Skip inactive or soft-deleted surveys
-        survey = assignment.survey
-        if not survey.is_active or survey.deleted_at is not None:
-            continue
+    # Skip surveys without published versions
+    survey_ids = list({a.survey_id for a in assignments})
+    version_ids = survey_service.get_latest_published_version_ids(survey_ids)
+    visible = [a for a in assignments if a.survey_id in version_ids]
 
-        result.append(AssignedSurveyResponse(
+    versions = _get_version_structures(
+        survey_service, list({version_ids[a.survey_id] for a in visible})
+    )
+
+    body = _ASSIGNED_SURVEYS_ADAPTER.dump_json([
+        AssignedSurveyResponse(
             assignment_id=assignment.id,
             survey_id=assignment.survey.id,
             survey_title=assignment.survey.title,
             survey_description=assignment.survey.description,
             assignment_status=assignment.status.value,
             assigned_location=assignment.location,
-            latest_version=latest_version,
+            latest_version=versions[version_ids[assignment.survey_id]],
             assigned_at=assignment.created_at
-        ))
-    
-    return result
+        )
+        for assignment in visible
+    ])
+    _store_surveys_payload(current_user.id, fingerprint, body)
+    return Response(content=body, media_type="application/json", headers={"ETag": response.headers["ETag"]})
 
 
 @router.get("/surveys/{survey_id}/latest", response_model=SurveyVersionResponse)
 def get_latest_survey_version(
     survey_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    request: Request,
+    response: Response,
+    service: SurveySvc,
     current_user: MobileUser
 ):
     """
@@ -219,15 +406,25 @@ def get_latest_survey_version(
     **Legacy endpoint** - prefer using GET /mobile/surveys instead.
     
     Used by mobile app to download individual survey structure.
+    The ETag is the version id: If-None-Match with it returns 304.
     """
-    service = SurveyService(db)
-    return service.get_latest_published_version(survey_id)
+    version_id = service.get_latest_published_version_ids([survey_id]).get(survey_id)
+    if version_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No published version available"
+        )
+
+    not_modified = check_not_modified(request, response, f"v{version_id}")
+    if not_modified:
+        return not_modified
+    return _get_version_structures(service, [version_id])[version_id]
 
 
 @router.post("/responses/batch", response_model=BatchResponseResult, status_code=201)
 def submit_batch_responses(
     batch_data: BatchResponseCreate,
-    db: Annotated[Session, Depends(get_db)],
+    service: ResponseSvc,
     current_user: MobileUser
 ):
     """
@@ -274,16 +471,16 @@ def submit_batch_responses(
     });
     ```
     """
-    service = ResponseService(db)
     return service.submit_batch_responses(batch_data.responses, current_user.id)
 
 
-@router.get("/responses/me")
+@router.get("/responses/me", response_model=PaginatedResponse[SurveyResponseDetail])
 def get_my_responses(
-    db: Annotated[Session, Depends(get_db)],
+    service: ResponseSvc,
     current_user: MobileUser,
     skip: int = Query(0, ge=0),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page; replaces skip"),
 ):
     """
     Get current user's submitted responses (paginated).
@@ -292,16 +489,23 @@ def get_my_responses(
     - View submission history
     - Check sync status
     - Re-download responses for offline viewing
+
+    Pass the returned next_cursor as `after` to page without OFFSET.
     """
-    service = ResponseService(db)
-    items = service.get_user_responses(current_user.id, skip=skip, limit=limit)
+    cursor = decode_cursor(after) if after else None
+    rows = service.get_user_responses(
+        current_user.id, skip=0 if cursor else skip, limit=limit + 1, after=cursor
+    )
+    has_more = len(rows) > limit
+    items = rows[:limit]
     total = service.count_user_responses(current_user.id)
     return {
         "items": items,
         "total": total,
         "skip": skip,
         "limit": limit,
-        "has_more": skip + limit < total,
+        "has_more": has_more,
+        "next_cursor": encode_cursor(items[-1].completed_at, items[-1].id) if has_more else None,
     }
 
 
@@ -372,154 +576,54 @@ def upload_document(
     - Pre-signed URL expires in 30 minutes
     - Document must be linked to existing response (client_id)
     """
-    # Validate file size (10MB limit)
-    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-    if request.file_size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File size {request.file_size} exceeds maximum {MAX_FILE_SIZE}"
-        )
-    
-    # Validate mime type
-    ALLOWED_TYPES = ['image/jpeg', 'image/png', 'application/pdf']
-    if request.mime_type not in ALLOWED_TYPES:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type: {request.mime_type}"
-        )
-    
-    # Check OCR confidence
-    ocr_confidence = request.metadata.ocr_confidence
-    low_confidence_warning = False
-    ocr_required = False
-    
-    if request.metadata.document_type in ['id_card', 'form', 'receipt']:
-        ocr_required = True
-        if ocr_confidence is not None and ocr_confidence < 0.7:
-            low_confidence_warning = True
-    
-    # Generate unique document ID
-    document_id = f"doc_{uuid.uuid4().hex[:12]}"
-    expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
-
     if not settings.cloudinary_configured:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Cloud storage not configured"
         )
 
-    # Configure Cloudinary SDK with credentials from settings
-    cloudinary.config(
-        cloud_name=settings.CLOUDINARY_CLOUD_NAME,
-        api_key=settings.CLOUDINARY_API_KEY,
-        api_secret=settings.CLOUDINARY_API_SECRET,
-        secure=True,
+    survey_id = _resolve_document_survey_id(db, request.client_id)
+    doc_record, upload = _prepare_document_upload(
+        request, current_user.id, survey_id, datetime.now(timezone.utc)
     )
+    db.add(doc_record)
+    db.commit()
+    return upload
 
-    # Determine Cloudinary resource_type
-    doc_type = (request.metadata.document_type if request.metadata else "photo").lower()
-    resource_type = "image" if request.mime_type.startswith("image/") else "raw"
-
-    # ── Smart folder hierarchy ─────────────────────────────────────────────
-    # brigada/surveys/{survey_id}/{year}/{month}/{doc_type}/q{question_id}/{doc_id}
-    #
-    # Enables Cloudinary prefix queries like:
-    #   brigada/surveys/7/**              → all files for survey 7
-    #   brigada/surveys/7/2026/02/**      → monthly slice
-    #   brigada/surveys/7/2026/02/photo/** → photos that month
-    #
-    now_utc = datetime.now(timezone.utc)
-    year_str = now_utc.strftime("%Y")
-    month_str = now_utc.strftime("%m")
-
-    # Resolve survey_id from client_id (response may not exist yet if uploading before submit)
-    survey_id = "unknown"
-    question_id = request.metadata.question_id if request.metadata else None
-    try:
-        resp_repo = ResponseRepository(db)
-        existing = resp_repo.get_by_client_id(request.client_id)
-        if existing:
-            from app.models.survey import SurveyVersion as SV
-            sv = db.query(SV).filter(SV.id == existing.version_id).first()
-            if sv:
-                survey_id = str(sv.survey_id)
-    except Exception:
-        pass  # Non-fatal — folder degrades gracefully to "unknown"
-
-    q_segment = f"q{question_id}" if question_id else "q-unknown"
-
-    folder = (
-        f"brigada/surveys/{survey_id}"
-        f"/{year_str}/{month_str}"
-        f"/{doc_type}"
-        f"/{q_segment}"
-    )
-    public_id = f"{folder}/{document_id}"
 
-    timestamp = int(now_utc.timestamp())
-    upload_params = {
-        "public_id": public_id,
-        "timestamp": timestamp,
-        "resource_type": resource_type,
-        "tags": [
-            f"survey_{survey_id}",
-            f"user_{current_user.id}",
-            f"type_{doc_type}",
-            f"year_{year_str}",
-            f"month_{year_str}_{month_str}",
-            *([f"question_{question_id}"] if question_id else []),
-            "brigada",
-        ],
-        # Store rich context as Cloudinary metadata (searchable in dashboard)
-        "context": "|".join([
-            f"survey_id={survey_id}",
-            f"user_id={current_user.id}",
-            f"doc_type={doc_type}",
-            f"client_id={request.client_id}",
-            *([f"question_id={question_id}"] if question_id else []),
-        ]),
-    }
-
-    # Generate Cloudinary signature
-    signature = cloudinary.utils.api_sign_request(
-        upload_params, settings.CLOUDINARY_API_SECRET
-    )
+@router.post("/documents/upload/batch", response_model=List[DocumentUploadResponse], status_code=201)
+def upload_documents_batch(
+    batch: BatchDocumentUploadRequest,
+    db: Annotated[Session, Depends(get_db)],
+    current_user: MobileUser
+):
+    """
+    Generate pre-signed upload URLs for several documents in one call.
 
-    upload_url = (
-        f"https://api.cloudinary.com/v1_1/{settings.CLOUDINARY_CLOUD_NAME}"
-        f"/{resource_type}/upload"
-    )
+    Same contract as `/documents/upload`, per document and in request
+    order, for the photos/signatures attached to a response. Up to 20
+    documents and 50MB declared in total; all rows are stored with one
+    commit and share the signature timestamp.
+    """
+    if not settings.cloudinary_configured:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Cloud storage not configured"
+        )
 
-    # ── Persist document record (status = pending) ─────────────────────────
-    doc_record = Document(
-        document_id=document_id,
-        user_id=current_user.id,
-        response_client_id=request.client_id,
-        question_id=question_id,
-        file_name=request.file_name,
-        file_size=request.file_size,
-        mime_type=request.mime_type,
-        document_type=doc_type,
-        cloudinary_public_id=public_id,
-        ocr_confidence=ocr_confidence,
-        status="pending",
-    )
-    db.add(doc_record)
+    now_utc = datetime.now(timezone.utc)
+    survey_ids: Dict[str, str] = {}
+    uploads = []
+    for request in batch.documents:
+        if request.client_id not in survey_ids:
+            survey_ids[request.client_id] = _resolve_document_survey_id(db, request.client_id)
+        doc_record, upload = _prepare_document_upload(
+            request, current_user.id, survey_ids[request.client_id], now_utc
+        )
+        db.add(doc_record)
+        uploads.append(upload)
     db.commit()
-
-    return DocumentUploadResponse(
-        document_id=document_id,
-        upload_url=upload_url,
-        expires_at=expires_at,
-        ocr_required=ocr_required,
-        low_confidence_warning=low_confidence_warning,
-        # Extra signed params the mobile app needs for the direct upload
-        cloudinary_signature=signature,
-        cloudinary_timestamp=timestamp,
-        cloudinary_api_key=settings.CLOUDINARY_API_KEY,
-        cloudinary_public_id=public_id,
-        cloudinary_folder=folder,
-    )
+    return uploads
 
 
 @router.post("/documents/confirm", response_model=DocumentConfirmResponse)
@@ -564,27 +668,12 @@ def confirm_document_upload(
     doc.confirmed_at = datetime.now(timezone.utc)
 
     # Back-fill media_url on the question_answers row for this document
+    # (one UPDATE ... FROM; matches nothing if the response isn't synced yet)
     answers_updated = 0
     if doc.question_id and doc.response_client_id:
-        from app.models.response import SurveyResponse, QuestionAnswer
-
-        response = (
-            db.query(SurveyResponse)
-            .filter(SurveyResponse.client_id == doc.response_client_id)
-            .first()
+        answers_updated = ResponseRepository(db).set_answer_media_url(
+            doc.response_client_id, doc.question_id, body.remote_url
         )
-        if response:
-            answer = (
-                db.query(QuestionAnswer)
-                .filter(
-                    QuestionAnswer.response_id == response.id,
-                    QuestionAnswer.question_id == doc.question_id,
-                )
-                .first()
-            )
-            if answer:
-                answer.media_url = body.remote_url
-                answers_updated = 1
 
     db.commit()
 
@@ -598,14 +687,15 @@ def confirm_document_upload(
 
 @router.get("/sync-status", response_model=SyncStatus)
 def get_sync_status(
-    db: Annotated[Session, Depends(get_db)],
+    service: ResponseSvc,
     current_user: MobileUser
 ):
     """
     Get sync status for mobile app.
     
     **Returns:**
-    - `synced_responses`: Total responses synced to server
+    - `synced_responses`: Total responses synced to server, capped at 500
+    - `synced_responses_truncated`: True when the real total is above the cap
     - `pending_responses`: Responses waiting to sync (client-side tracking)
     - `pending_documents`: Documents waiting to upload
     - `last_sync`: Timestamp of last successful sync
@@ -639,43 +729,16 @@ def get_sync_status(
     }, 60000); // Every minute
     ```
     """
-    response_service = ResponseService(db)
-    assignment_repo = AssignmentRepository(db)
-
-    # ── Synced responses count ────────────────────────────────────────────
-    synced_responses = response_service.get_sync_status(current_user.id)["synced_responses"]
-
-    # ── Assigned surveys count ────────────────────────────────────────────
-    assignments = assignment_repo.get_by_user(current_user.id)
-    assigned_surveys_count = len(assignments)
-
-    # ── Pending documents (uploads not yet confirmed) ─────────────────────
-    pending_documents = (
-        db.query(Document)
-        .filter(
-            Document.user_id == current_user.id,
-            Document.status == "pending",
-        )
-        .count()
-    )
-
-    # ── Last sync timestamp (most recent synced_at from user's responses) ─
-    from sqlalchemy import func as sqlfunc
-    from app.models.response import SurveyResponse
-
-    last_sync_row = (
-        db.query(sqlfunc.max(SurveyResponse.synced_at))
-        .filter(SurveyResponse.user_id == current_user.id)
-        .scalar()
-    )
+    counters = service.get_sync_status(current_user.id)
 
     return SyncStatus(
         user_id=current_user.id,
         pending_responses=0,  # Client-side only — server can't know what's queued on the device
-        synced_responses=synced_responses,
-        pending_documents=pending_documents,
-        last_sync=last_sync_row,
-        assigned_surveys=assigned_surveys_count,
+        synced_responses=counters["synced_responses"],
+        synced_responses_truncated=counters["synced_responses_truncated"],
+        pending_documents=counters["pending_documents"],  # Uploads not yet confirmed
+        last_sync=counters["last_sync"],
+        assigned_surveys=counters["assigned_surveys"],
         available_updates=[],  # Requires client→server version negotiation (future)
     )
 
@@ -697,10 +760,9 @@ def get_my_notifications(
     and global notifications (user_id == None) if any exist.
     """
     service = NotificationService(db)
-    notifications = service.get_notifications(
+    notifications, unread_count = service.get_notifications_with_unread_count(
         skip=skip, limit=limit, unread_only=unread_only, user_id=current_user.id
     )
-    unread_count = service.get_unread_count(user_id=current_user.id)
     return NotificationListResponse(notifications=notifications, unread_count=unread_count)
 
 
@@ -722,7 +784,8 @@ def mark_my_notification_read(
 ):
     """Mark a specific notification as read (only if owned by current user)."""
     from app.models.notification import Notification
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+    # By primary key: mark_read's own lookup is then served from the identity map
+    notification = db.get(Notification, notification_id)
     if not notification:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found")
     if notification.user_id is not None and notification.user_id != current_user.id:
@@ -741,7 +804,7 @@ def mark_all_my_notifications_read(
     count = (
         db.query(Notification)
         .filter(Notification.user_id == current_user.id, Notification.read == False)  # noqa: E712
-        .update({"read": True})
+        .update({"read": True}, synchronize_session=False)  # served by ix_notifications_unread
     )
     db.commit()
     return {"updated": count}
@@ -0,0 +1,52 @@
+"""Opaque keyset cursors shared by the paginated list endpoints."""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(completed_at: datetime, row_id: int) -> str:
+    """Opaque keyset cursor: (completed_at, id) of the last row returned."""
+    raw = json.dumps([completed_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor; 400 on anything it did not produce."""
+    try:
+        completed_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(completed_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def encode_sort_cursor(sort_by: str, value: Any, row_id: int) -> str:
+    """Keyset cursor for lists with a selectable sort: (sort_by, value, id)."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort_by, value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_sort_cursor(cursor: str, sort_by: str) -> Tuple[Any, int]:
+    """
+    Inverse of encode_sort_cursor; 400 on cursors minted for another sort.
+    Values of *_at sort columns come back as datetimes.
+    """
+    try:
+        cursor_sort, value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if cursor_sort != sort_by:
+            raise ValueError("sort mismatch")
+        if sort_by.endswith("_at"):
+            value = datetime.fromisoformat(value)
+        return value, int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
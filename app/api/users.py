@@ -132,7 +132,6 @@ def update_user(
             details={"before": old_role.value if hasattr(old_role, 'value') else str(old_role),
                      "after": user_data.role.value if hasattr(user_data.role, 'value') else str(user_data.role)},
         ))
-        db.commit()
 
     # Audit: is_active toggle
     if user_data.is_active is not None and user_data.is_active != old_active:
@@ -143,6 +142,9 @@ def update_user(
             target_id=user_id,
             details={"before": old_active, "after": user_data.is_active},
         ))
+
+    # One commit for however many audit rows this update produced
+    if db.new:
         db.commit()
 
     return updated
@@ -161,8 +163,8 @@ async def update_own_avatar(
     to the user's avatar_url field.
     Accepts JPEG or PNG files (max 5 MB).
     """
-    import cloudinary
     import cloudinary.uploader
+    import app.core.storage  # noqa: F401  (configures the Cloudinary SDK)
     from app.core.config import settings
 
     if not settings.cloudinary_configured:
@@ -186,12 +188,6 @@ async def update_own_avatar(
             detail="La imagen no puede superar 5 MB.",
         )
 
-    cloudinary.config(
-        cloud_name=settings.CLOUDINARY_CLOUD_NAME,
-        api_key=settings.CLOUDINARY_API_KEY,
-        api_secret=settings.CLOUDINARY_API_SECRET,
-    )
-
     try:
         result = cloudinary.uploader.upload(
             content,
@@ -39,6 +39,10 @@ class Settings(BaseSettings):
     FROM_NAME: str = "Brigada"
     ISSUE_REPORT_RECIPIENT: str = "brigadadigitalmorena@gmail.com"
     
+    # Rate limiting: memory:// keeps counters per worker process; point it at
+    # redis://host:6379 to share them across workers
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    
     # Neon API (for quota service)
     NEON_API_KEY: str = ""
     
@@ -17,6 +17,10 @@ engine = create_engine(
     connect_args={
         "connect_timeout": 20,   # TCP connection timeout (Neon cold start)
     },
+    # LRU of compiled SQL keyed by statement structure (bound values excluded),
+    # shared by Query and select(). The filter/sort permutations of the admin
+    # list endpoints outgrow the default 500 entries and would recompile.
+    query_cache_size=1200,
     echo=settings.ENVIRONMENT == "development"
 )
 
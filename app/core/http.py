@@ -0,0 +1,24 @@
+"""Shared outbound HTTP clients.
+
+One pooled httpx.AsyncClient per upstream, created at import and closed on
+application shutdown (see app.main), so requests reuse keep-alive
+connections instead of paying a TLS handshake per call.
+"""
+
+import httpx
+
+from app.core.config import settings
+
+
+RESEND_API_BASE = "https://api.resend.com"
+
+resend_client = httpx.AsyncClient(
+    base_url=RESEND_API_BASE,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    headers={"Authorization": f"Bearer {settings.RESEND_API_KEY}"},
+)
+
+
+async def close_http_clients() -> None:
+    await resend_client.aclose()
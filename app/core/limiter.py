@@ -1,5 +1,21 @@
 """Shared rate limiter instance (slowapi)."""
+from fastapi import Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-limiter = Limiter(key_func=get_remote_address)
+from app.core.config import settings
+
+
+def user_or_ip_key(request: Request) -> str:
+    """
+    Rate-limit key for authenticated routes: the user id recorded by
+    get_current_user (dependencies resolve before slowapi checks the limit),
+    falling back to the client IP.
+    """
+    user_id = getattr(request.state, "user_id", None)
+    if user_id is not None:
+        return f"user:{user_id}"
+    return get_remote_address(request)
+
+
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.RATE_LIMIT_STORAGE_URI)
@@ -0,0 +1,83 @@
+"""Background refresh for materialized views pg_cron isn't scheduling.
+
+Each view's migration registers a pg_cron job when the extension is
+installed. On databases without it, this module refreshes the view from a
+background task started with the application (see app.main), so request
+handlers only ever read the current copy and never pay for a REFRESH.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# view name -> (pg_cron job name from its migration, refresh interval in seconds)
+MATERIALIZED_VIEWS: Dict[str, Tuple[str, float]] = {
+    "mv_activation_stats": ("refresh-activation-stats", 300.0),
+    "mv_survey_response_stats": ("refresh-survey-response-stats", 60.0),
+}
+
+_refresh_tasks: List[asyncio.Task] = []
+
+
+def _unscheduled_views() -> List[str]:
+    """Views whose pg_cron job does not exist (all of them without pg_cron)."""
+    db = SessionLocal()
+    try:
+        has_cron = db.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron')"
+        )).scalar()
+        if not has_cron:
+            return list(MATERIALIZED_VIEWS)
+        scheduled = set(db.execute(text(
+            "SELECT jobname FROM cron.job WHERE jobname = ANY(:jobs)"
+        ), {"jobs": [job for job, _ in MATERIALIZED_VIEWS.values()]}).scalars())
+        return [view for view, (job, _) in MATERIALIZED_VIEWS.items() if job not in scheduled]
+    finally:
+        db.close()
+
+
+def _refresh_view(view: str) -> None:
+    db = SessionLocal()
+    try:
+        # With several workers only one refreshes; the others skip this round
+        locked = db.execute(
+            text("SELECT pg_try_advisory_xact_lock(hashtext(:view))"), {"view": view}
+        ).scalar()
+        if locked:
+            db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _refresh_loop(view: str, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_refresh_view, view)
+        except Exception:
+            logger.exception("Refreshing %s failed", view)
+
+
+async def start_view_refresh() -> None:
+    try:
+        views = await asyncio.to_thread(_unscheduled_views)
+    except Exception:
+        logger.exception("Could not check pg_cron jobs; materialized views are not refreshed in-process")
+        return
+    for view in views:
+        _, interval = MATERIALIZED_VIEWS[view]
+        _refresh_tasks.append(asyncio.create_task(_refresh_loop(view, interval)))
+
+
+async def stop_view_refresh() -> None:
+    for task in _refresh_tasks:
+        task.cancel()
+    await asyncio.gather(*_refresh_tasks, return_exceptions=True)
+    _refresh_tasks.clear()
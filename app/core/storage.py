@@ -0,0 +1,32 @@
+"""Cloudinary storage setup.
+
+The Cloudinary SDK keeps its credentials in a process-wide singleton, so it
+is configured once at import instead of on every upload request.
+"""
+
+from typing import Any, Dict
+
+import cloudinary
+import cloudinary.utils
+
+from app.core.config import settings
+
+
+# Direct-upload endpoint per resource_type (the only two upload_document uses)
+CLOUDINARY_UPLOAD_URLS = {
+    resource_type: f"https://api.cloudinary.com/v1_1/{settings.CLOUDINARY_CLOUD_NAME}/{resource_type}/upload"
+    for resource_type in ("image", "raw")
+}
+
+if settings.cloudinary_configured:
+    cloudinary.config(
+        cloud_name=settings.CLOUDINARY_CLOUD_NAME,
+        api_key=settings.CLOUDINARY_API_KEY,
+        api_secret=settings.CLOUDINARY_API_SECRET,
+        secure=True,
+    )
+
+
+def sign_upload_params(params: Dict[str, Any]) -> str:
+    """Sign direct-upload parameters for a client-side Cloudinary upload."""
+    return cloudinary.utils.api_sign_request(params, settings.CLOUDINARY_API_SECRET)
@@ -5,11 +5,13 @@ import uuid
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
+from app.core.http import close_http_clients
 from app.core.limiter import limiter
+from app.core.matviews import start_view_refresh, stop_view_refresh
 from app.core.ops_metrics import observe_mobile_latency
 from app.api import auth, users, admin_surveys, assignments, mobile, admin_responses, admin_activation, public_activation, issue_reporting, notifications, admin_stats, ocr
 
@@ -19,7 +21,10 @@ app = FastAPI(
     description="Backend API for mobile survey collection system",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson encodes the validated response_model output (datetimes included)
+    # in C instead of the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
 CURRENT_MOBILE_API_VERSION = "2026.1"
@@ -132,6 +137,22 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
 # Rate limiter
 app.state.limiter = limiter
 
+
+@app.on_event("startup")
+async def start_materialized_view_refresh():
+    await start_view_refresh()
+
+
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+    await close_http_clients()
+
+
+@app.on_event("shutdown")
+async def stop_materialized_view_refresh():
+    await stop_view_refresh()
+
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -1,7 +1,8 @@
 """Activation Code Model"""
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, CheckConstraint, Index, and_
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -62,6 +63,13 @@ class ActivationCode(Base):
             "activation_attempts >= 0",
             name="check_attempts_positive"
         ),
+        # "Does this whitelist entry have a usable code?" lookups
+        Index(
+            "ix_activation_codes_active",
+            whitelist_id,
+            expires_at.desc(),
+            postgresql_where=(is_used == False),  # noqa: E712
+        ),
     )
 
     @property
@@ -74,6 +82,20 @@ class ActivationCode(Base):
         """Check if code is locked (too many failed attempts)"""
         return 5 <= self.activation_attempts < 999
 
+    @hybrid_property
+    def is_active(self) -> bool:
+        """Usable right now: not used, not expired, not locked and not revoked"""
+        # attempts < 5 rules out both locked (5..998) and revoked (>= 999)
+        return not self.is_used and not self.is_expired and self.activation_attempts < 5
+
+    @is_active.expression
+    def is_active(cls):
+        return and_(
+            cls.is_used == False,  # noqa: E712
+            cls.expires_at > func.now(),
+            cls.activation_attempts < 5,
+        )
+
     @property
     def status(self) -> str:
         """Get computed status of the code"""
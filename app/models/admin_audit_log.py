@@ -1,5 +1,5 @@
 """Admin audit log model — records destructive or sensitive admin actions."""
-from sqlalchemy import Column, BigInteger, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import JSONB
@@ -17,6 +17,10 @@ class AdminAuditLog(Base):
         user.role_change     – role promoted or demoted by an admin
         user.status_change   – is_active toggled by an admin
         assignment.delete    – assignment hard-deleted
+
+    The table is range-partitioned by month on created_at, with partitions
+    managed by pg_partman (migration f6b3d8a2c4e7). Its database primary key is
+    therefore (id, created_at), but id alone is unique and is what the ORM keys on.
     """
 
     __tablename__ = "admin_audit_log"
@@ -47,7 +51,6 @@ class AdminAuditLog(Base):
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
 
     # Relationships
@@ -57,6 +60,22 @@ class AdminAuditLog(Base):
         back_populates="admin_audit_logs",
     )
 
+    __table_args__ = (
+        # Rows are inserted in created_at order, so BRIN replaces a btree here
+        Index(
+            "ix_admin_audit_log_created_brin",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_admin_audit_log_details_gin",
+            details,
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<AdminAuditLog(id={self.id}, actor={self.actor_id}, "
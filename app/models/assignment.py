@@ -1,5 +1,5 @@
 """Assignment models."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum
@@ -27,10 +27,10 @@ class Assignment(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     # The user who must fill the survey (brigadista OR encargado)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     survey_id = Column(Integer, ForeignKey("surveys.id", ondelete="CASCADE"), nullable=False, index=True)
     # FK to the user who created this assignment (admin / encargado)
-    assigned_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    assigned_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     status = Column(
         SQLEnum(AssignmentStatus, values_callable=lambda x: [e.value for e in x]),
         default=AssignmentStatus.ACTIVE,
@@ -47,5 +47,13 @@ class Assignment(Base):
     assigned_by_user = relationship("User", foreign_keys=[assigned_by])
     survey = relationship("Survey", back_populates="assignments")
 
+    __table_args__ = (
+        # Team lookups (assigned_by, status) answered from the index alone;
+        # assigned_by as the leading column also serves the FK's ON DELETE
+        Index("ix_assignments_assigned_by_status_user", assigned_by, status, user_id),
+        # A user's assignments, optionally by status (also serves the user FK)
+        Index("ix_assignments_user_status", user_id, status),
+    )
+
     def __repr__(self):
         return f"<Assignment(id={self.id}, user_id={self.user_id}, survey_id={self.survey_id}, status={self.status})>"
@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Text,
 )
 from sqlalchemy.orm import relationship
@@ -30,14 +31,13 @@ class Document(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Unique identifier generated server-side (``doc_<hex>``)
-    document_id = Column(String(64), unique=True, nullable=False, index=True)
+    document_id = Column(String(64), unique=True, nullable=False)
 
     # The user who initiated the upload
     user_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Link to the response this file belongs to (via client_id)
@@ -64,7 +64,7 @@ class Document(Base):
     ocr_confidence = Column(Float, nullable=True)
 
     # Status: pending | uploaded | error
-    status = Column(String(20), nullable=False, default="pending", index=True)
+    status = Column(String(20), nullable=False, default="pending")
 
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -73,3 +73,19 @@ class Document(Base):
 
     # Relationships
     user = relationship("User", backref="documents")
+
+    __table_args__ = (
+        # "My documents" / per-user pending count (migration b4d9f2a6c8e3)
+        Index(
+            "ix_documents_user_status_created",
+            user_id,
+            status,
+            created_at.desc(),
+        ),
+        # Review queue: only the small pending slice, newest first
+        Index(
+            "ix_documents_pending",
+            created_at.desc(),
+            postgresql_where=(status == "pending"),
+        ),
+    )
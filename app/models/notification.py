@@ -1,5 +1,5 @@
 """Notification model."""
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -10,7 +10,7 @@ class Notification(Base):
     """Notification model. user_id=None means global (admin-wide) notification."""
     __tablename__ = "notifications"
 
-    id         = Column(Integer, primary_key=True, index=True)
+    id         = Column(Integer, primary_key=True)
     user_id    = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
     type       = Column(String(50), nullable=False)          # survey_created, assignment_created, user_registered, version_published, survey_deleted
     title      = Column(String(255), nullable=False)
@@ -20,3 +20,14 @@ class Notification(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user = relationship("User", back_populates="notifications", foreign_keys=[user_id])
+
+    __table_args__ = (
+        # Unread badge/list polling: only unread rows, newest first per user (NULL = global)
+        Index(
+            "ix_notifications_unread",
+            user_id,
+            created_at.desc(),
+            postgresql_include=["id", "type", "title", "action_url"],
+            postgresql_where=(read == False),  # noqa: E712
+        ),
+    )
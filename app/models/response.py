@@ -1,5 +1,5 @@
 """Survey response models."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -15,7 +15,7 @@ class SurveyResponse(Base):
     __tablename__ = "survey_responses"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     version_id = Column(Integer, ForeignKey("survey_versions.id", ondelete="RESTRICT"), nullable=False)
     
     # Offline sync support
@@ -34,6 +34,31 @@ class SurveyResponse(Base):
     user = relationship("User", back_populates="survey_responses")
     version = relationship("SurveyVersion", back_populates="responses")
     answers = relationship("QuestionAnswer", back_populates="response", cascade="all, delete-orphan")
+
+    # Covering composites (see migration a3c8e1f5d7b9); user_id has no
+    # standalone index because it is the left prefix of the second one.
+    __table_args__ = (
+        Index(
+            "ix_survey_responses_version_completed",
+            version_id,
+            completed_at.desc(),
+            postgresql_include=["user_id", "id"],
+        ),
+        # id in the key so the (completed_at, id) keyset order is read
+        # straight off the index (migration b9e2c4a7d1f3)
+        Index(
+            "ix_survey_responses_user_completed_id",
+            user_id,
+            completed_at.desc(),
+            id.desc(),
+        ),
+        # Last sync per user for /mobile/sync-status (migration e5a9c3f7b1d8)
+        Index(
+            "ix_survey_responses_user_synced",
+            user_id,
+            synced_at.desc(),
+        ),
+    )
     
     def __repr__(self):
         return f"<SurveyResponse(id={self.id}, user_id={self.user_id}, version_id={self.version_id})>"
@@ -48,7 +73,7 @@ class QuestionAnswer(Base):
     __tablename__ = "question_answers"
     
     id = Column(Integer, primary_key=True, index=True)
-    response_id = Column(Integer, ForeignKey("survey_responses.id", ondelete="CASCADE"), nullable=False, index=True)
+    response_id = Column(Integer, ForeignKey("survey_responses.id", ondelete="CASCADE"), nullable=False)
     question_id = Column(Integer, ForeignKey("questions.id", ondelete="RESTRICT"), nullable=False)
     
     # Flexible answer storage
@@ -63,6 +88,15 @@ class QuestionAnswer(Base):
     # Relationships
     response = relationship("SurveyResponse", back_populates="answers")
     question = relationship("Question", back_populates="answers")
+
+    __table_args__ = (
+        Index(
+            "ix_question_answers_response_question",
+            response_id,
+            question_id,
+            postgresql_include=["id"],
+        ),
+    )
     
     def __repr__(self):
         return f"<QuestionAnswer(id={self.id}, question_id={self.question_id})>"
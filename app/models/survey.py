@@ -1,5 +1,5 @@
 """Survey models."""
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, Enum as SQLEnum, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum
@@ -89,6 +89,16 @@ class SurveyVersion(Base):
         order_by="Question.order",
     )
     responses = relationship("SurveyResponse", back_populates="version")
+
+    __table_args__ = (
+        # Latest-published lookups per survey, index-only (migration c7a1e9d3b5f2)
+        Index(
+            "ix_survey_versions_survey_number",
+            survey_id,
+            version_number.desc(),
+            postgresql_include=["id", "is_published"],
+        ),
+    )
     
     def __repr__(self):
         return f"<SurveyVersion(id={self.id}, survey_id={self.survey_id}, version={self.version_number})>"
@@ -1,5 +1,5 @@
 """User model."""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum
@@ -46,6 +46,16 @@ class User(Base):
     generated_activation_codes = relationship("ActivationCode", foreign_keys="ActivationCode.generated_by", back_populates="generator")
     activation_audit_logs = relationship("ActivationAuditLog", foreign_keys="ActivationAuditLog.created_user_id", back_populates="created_user")
     admin_audit_logs = relationship("AdminAuditLog", foreign_keys="AdminAuditLog.actor_id", back_populates="actor")
+
+    __table_args__ = (
+        # Role/status filters always come with deleted_at IS NULL; index live accounts only
+        Index(
+            "ix_users_role_active_live",
+            role,
+            is_active,
+            postgresql_where=(deleted_at == None),  # noqa: E711
+        ),
+    )
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
@@ -1,7 +1,7 @@
 """User Whitelist Model"""
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, CheckConstraint, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -63,7 +63,19 @@ class UserWhitelist(Base):
             """,
             name="check_activated_consistency"
         ),
+        # Keyset pagination of the admin list (newest first)
+        Index("ix_whitelist_created_id", created_at.desc(), id.desc()),
     )
 
+    @property
+    def created_by_name(self) -> Optional[str]:
+        """Full name of the admin who created the entry"""
+        return self.creator.full_name if self.creator else None
+
+    @property
+    def activated_user_name(self) -> Optional[str]:
+        """Full name of the user account created from this entry"""
+        return self.activated_user.full_name if self.activated_user else None
+
     def __repr__(self) -> str:
         return f"<UserWhitelist(id={self.id}, identifier={self.identifier}, role={self.assigned_role}, activated={self.is_activated})>"
@@ -1,7 +1,8 @@
 """Assignment repository."""
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, literal, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.sql import func as sqlfunc
 
 from app.models.assignment import Assignment, AssignmentStatus
@@ -27,6 +28,29 @@ class AssignmentRepository:
             .scalar() or 0
         )
 
+    def get_response_counts(self, assignments: Iterable[Assignment]) -> Dict[Tuple[int, int], int]:
+        """
+        Response counts for many assignments in one GROUP BY query, keyed by
+        (user_id, survey_id). Pairs with no responses are absent.
+        """
+        from app.models.response import SurveyResponse
+        from app.models.survey import SurveyVersion
+        pairs = {(a.user_id, a.survey_id) for a in assignments}
+        if not pairs:
+            return {}
+        rows = (
+            self.db.query(
+                SurveyResponse.user_id,
+                SurveyVersion.survey_id,
+                func.count(SurveyResponse.id),
+            )
+            .join(SurveyVersion, SurveyResponse.version_id == SurveyVersion.id)
+            .filter(tuple_(SurveyResponse.user_id, SurveyVersion.survey_id).in_(pairs))
+            .group_by(SurveyResponse.user_id, SurveyVersion.survey_id)
+            .all()
+        )
+        return {(user_id, survey_id): count for user_id, survey_id, count in rows}
+
     def create(self, user_id: int, survey_id: int, assigned_by: Optional[int],
                location: Optional[str] = None,
                notes: Optional[str] = None) -> Assignment:
@@ -66,12 +90,24 @@ class AssignmentRepository:
         return query.order_by(Assignment.created_at.desc()).offset(skip).limit(limit).all()
 
     def get_by_user(self, user_id: int, status: Optional[AssignmentStatus] = None,
-                    skip: int = 0, limit: int = 100) -> List[Assignment]:
-        """Get assignments for a user (excludes soft-deleted)."""
+                    skip: int = 0, limit: int = 100,
+                    live_surveys_only: bool = False) -> List[Assignment]:
+        """
+        Get assignments for a user (excludes soft-deleted).
+        live_surveys_only joins the survey, keeps active, non-deleted ones in
+        SQL and fills assignment.survey from the same row.
+        """
+        from sqlalchemy.orm import contains_eager
+        from app.models.survey import Survey
         query = self.db.query(Assignment).filter(
             Assignment.user_id == user_id,
             Assignment.deleted_at == None,
         )
+        if live_surveys_only:
+            query = query.join(Assignment.survey).filter(
+                Survey.is_active == True,  # noqa: E712
+                Survey.deleted_at == None,  # noqa: E711
+            ).options(contains_eager(Assignment.survey))
         
         if status is not None:
             query = query.filter(Assignment.status == status)
@@ -96,6 +132,84 @@ class AssignmentRepository:
             query = query.filter(Assignment.status == status)
         return query.order_by(Assignment.created_at.desc()).offset(skip).limit(limit).all()
 
+    def get_assigned_user_ids(self, assigned_by_id: int) -> List[int]:
+        """
+        Distinct ids of users holding a non-deleted assignment created by this
+        encargado, any status. Read from ix_assignments_assigned_by_status_user
+        without loading assignment rows.
+        """
+        return list(
+            self.db.execute(
+                select(Assignment.user_id)
+                .where(
+                    Assignment.assigned_by == assigned_by_id,
+                    Assignment.deleted_at == None,  # noqa: E711
+                )
+                .distinct()
+            ).scalars()
+        )
+
+    def get_user_fingerprint(self, user_id: int,
+                             status: Optional[AssignmentStatus] = None) -> str:
+        """
+        md5 over everything /mobile/surveys returns for this user besides the
+        version structures: each visible assignment's fields, its survey's
+        title/description and the id of the latest published version. One
+        aggregate query; no rows are loaded.
+        """
+        from app.models.survey import Survey, SurveyVersion
+        latest = (
+            select(SurveyVersion.id)
+            .where(
+                SurveyVersion.survey_id == Survey.id,
+                SurveyVersion.is_published == True,  # noqa: E712
+            )
+            .order_by(SurveyVersion.version_number.desc())
+            .limit(1)
+            .lateral("latest_version")
+        )
+        row_text = func.concat_ws(
+            "|", Assignment.id, Assignment.status, Assignment.location,
+            Assignment.created_at, Survey.title, Survey.description, latest.c.id,
+        )
+        stmt = (
+            select(func.md5(func.coalesce(
+                func.string_agg(row_text, aggregate_order_by(literal("\n"), Assignment.id)),
+                "",
+            )))
+            .select_from(Assignment)
+            .join(Survey, Survey.id == Assignment.survey_id)
+            .join(latest, true())
+            .where(
+                Assignment.user_id == user_id,
+                Assignment.deleted_at == None,  # noqa: E711
+                Survey.is_active == True,  # noqa: E712
+                Survey.deleted_at == None,  # noqa: E711
+            )
+        )
+        if status is not None:
+            stmt = stmt.where(Assignment.status == status)
+        return self.db.execute(stmt).scalar_one()
+
+    def get_team_members(self, assigned_by_id: int) -> List["User"]:
+        """
+        Distinct users holding at least one active, non-deleted assignment
+        created by this encargado. The dedup happens in SQL (semi-join), so
+        there is no row cap and no per-assignment loading.
+        """
+        from app.models.user import User
+        team_ids = select(Assignment.user_id).where(
+            Assignment.assigned_by == assigned_by_id,
+            Assignment.status == AssignmentStatus.ACTIVE,
+            Assignment.deleted_at == None,
+        )
+        return (
+            self.db.query(User)
+            .filter(User.id.in_(team_ids))
+            .order_by(User.full_name)
+            .all()
+        )
+
     def get_by_survey(self, survey_id: int, status: Optional[AssignmentStatus] = None,
                      skip: int = 0, limit: int = 100) -> List[Assignment]:
         """Get assignments for a survey (excludes soft-deleted)."""
@@ -144,13 +258,27 @@ class AssignmentRepository:
         self.db.refresh(assignment)
         return assignment
     
-    def delete(self, assignment_id: int) -> bool:
-        """Soft-delete assignment (stamps deleted_at, sets status INACTIVE)."""
-        assignment = self.get_by_id(assignment_id)
-        if not assignment:
-            return False
+    def delete(self, assignment_id: int) -> Optional[Tuple[int, int, AssignmentStatus]]:
+        """
+        Soft-delete assignment (stamps deleted_at, sets status INACTIVE) in a
+        single UPDATE ... RETURNING. Does not commit, so the caller can write
+        its audit row in the same transaction.
 
-        assignment.deleted_at = sqlfunc.now()
-        assignment.status = AssignmentStatus.INACTIVE
-        self.db.commit()
-        return True
+        Returns (user_id, survey_id, status before deletion), or None if no
+        live assignment matched.
+        """
+        previous = (
+            select(Assignment.id, Assignment.status)
+            .where(Assignment.id == assignment_id, Assignment.deleted_at == None)  # noqa: E711
+            .with_for_update()
+            .subquery()
+        )
+        stmt = (
+            update(Assignment)
+            .where(Assignment.id == previous.c.id)
+            .values(deleted_at=sqlfunc.now(), status=AssignmentStatus.INACTIVE)
+            .returning(Assignment.user_id, Assignment.survey_id, previous.c.status)
+            .execution_options(synchronize_session=False)
+        )
+        row = self.db.execute(stmt).first()
+        return tuple(row) if row else None
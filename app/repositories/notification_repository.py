@@ -1,6 +1,7 @@
 """Notification repository."""
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
 
 from app.models.notification import Notification
 
@@ -48,6 +49,40 @@ class NotificationRepository:
             .all()
         )
 
+    def get_page_with_unread_count(
+        self, skip: int = 0, limit: int = 50, unread_only: bool = False, user_id: Optional[int] = None
+    ) -> Tuple[List[Notification], int]:
+        """
+        get_all and get_unread_count in one round trip: the count rides on
+        each page row as a scalar subquery. Only an empty page needs a
+        separate count query.
+        """
+        counted = aliased(Notification)
+        unread = (
+            select(func.count(counted.id))
+            .where(
+                counted.user_id == user_id if user_id is not None else counted.user_id == None,  # noqa: E711
+                counted.read == False,  # noqa: E712
+            )
+            .scalar_subquery()
+        )
+        query = self.db.query(Notification, unread)
+        if user_id is not None:
+            query = query.filter(Notification.user_id == user_id)
+        else:
+            query = query.filter(Notification.user_id == None)  # noqa: E711
+        if unread_only:
+            query = query.filter(Notification.read == False)  # noqa: E712
+        rows = (
+            query.order_by(Notification.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        if not rows:
+            return [], self.get_unread_count(user_id=user_id)
+        return [notification for notification, _ in rows], rows[0][1]
+
     def get_unread_count(self, user_id: Optional[int] = None) -> int:
         """Count unread notifications. Filters by user_id if provided, else global."""
         query = self.db.query(Notification).filter(Notification.read == False)  # noqa: E712
@@ -59,7 +94,7 @@ class NotificationRepository:
 
     def mark_read(self, notification_id: int) -> Optional[Notification]:
         """Mark a single notification as read."""
-        notification = self.db.query(Notification).filter(Notification.id == notification_id).first()
+        notification = self.db.get(Notification, notification_id)
         if notification:
             notification.read = True
             self.db.commit()
@@ -71,7 +106,7 @@ class NotificationRepository:
         count = (
             self.db.query(Notification)
             .filter(Notification.read == False)  # noqa: E712
-            .update({"read": True})
+            .update({"read": True}, synchronize_session=False)
         )
         self.db.commit()
         return count
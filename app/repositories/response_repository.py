@@ -1,7 +1,9 @@
 """Response repository."""
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import and_, func, insert, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.response import SurveyResponse, QuestionAnswer
 
@@ -43,12 +45,49 @@ class ResponseRepository:
             .filter(SurveyResponse.client_id == client_id)\
             .first()
     
-    def get_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[SurveyResponse]:
-        """Get all responses by user (with answers eagerly loaded)."""
-        return self.db.query(SurveyResponse)\
+    def get_survey_id_by_client_id(self, client_id: str) -> Optional[int]:
+        """Survey id of the response with this client ID, in one joined lookup."""
+        from app.models.survey import SurveyVersion
+
+        return self.db.query(SurveyVersion.survey_id)\
+            .join(SurveyResponse, SurveyResponse.version_id == SurveyVersion.id)\
+            .filter(SurveyResponse.client_id == client_id)\
+            .scalar()
+    
+    def set_answer_media_url(self, client_id: str, question_id: int, media_url: str) -> int:
+        """
+        Back-fill media_url on the answers to question_id in the response with
+        this client ID, as one UPDATE ... FROM survey_responses (no commit).
+        Returns the number of answers updated.
+        """
+        result = self.db.execute(
+            update(QuestionAnswer)
+            .where(
+                QuestionAnswer.response_id == SurveyResponse.id,
+                SurveyResponse.client_id == client_id,
+                QuestionAnswer.question_id == question_id,
+            )
+            .values(media_url=media_url)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def get_by_user(self, user_id: int, skip: int = 0, limit: int = 100,
+                    after: Optional[Tuple[datetime, int]] = None) -> List[SurveyResponse]:
+        """
+        Get responses by user, newest first (with answers eagerly loaded).
+        after=(completed_at, id) of the last row seen seeks past it on
+        ix_survey_responses_user_completed_id instead of skipping rows.
+        """
+        query = self.db.query(SurveyResponse)\
             .options(joinedload(SurveyResponse.answers))\
-            .filter(SurveyResponse.user_id == user_id)\
-            .order_by(SurveyResponse.completed_at.desc())\
+            .filter(SurveyResponse.user_id == user_id)
+        if after is not None:
+            query = query.filter(
+                tuple_(SurveyResponse.completed_at, SurveyResponse.id) < tuple_(*after)
+            )
+        return query\
+            .order_by(SurveyResponse.completed_at.desc(), SurveyResponse.id.desc())\
             .offset(skip).limit(limit)\
             .all()
     
@@ -84,6 +123,29 @@ class ResponseRepository:
         self.db.refresh(answer)
         return answer
     
+    def insert_responses(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insert many responses with one INSERT ... ON CONFLICT (client_id)
+        DO NOTHING RETURNING. Does not commit.
+
+        Returns client_id -> id for the rows actually inserted; client_ids
+        that already exist are skipped by the database and absent here.
+        """
+        if not rows:
+            return {}
+        result = self.db.execute(
+            pg_insert(SurveyResponse)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[SurveyResponse.client_id])
+            .returning(SurveyResponse.client_id, SurveyResponse.id)
+        )
+        return dict(result.all())
+
+    def insert_answers(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert many answers in one batched executemany. Does not commit."""
+        if rows:
+            self.db.execute(insert(QuestionAnswer), rows)
+
     def exists_by_client_id(self, client_id: str) -> bool:
         """Check if response exists by client ID."""
         return self.db.query(SurveyResponse)\
@@ -95,3 +157,14 @@ class ResponseRepository:
         return self.db.query(SurveyResponse)\
             .filter(SurveyResponse.user_id == user_id)\
             .count()
+
+    def count_answers_by_response(self, response_ids: Sequence[int]) -> Dict[int, int]:
+        """Answer counts for many responses in one grouped query (ids with no answers are absent)."""
+        if not response_ids:
+            return {}
+        return dict(
+            self.db.query(QuestionAnswer.response_id, func.count(QuestionAnswer.id))
+            .filter(QuestionAnswer.response_id.in_(response_ids))
+            .group_by(QuestionAnswer.response_id)
+            .all()
+        )
@@ -1,7 +1,6 @@
 """Survey repository."""
 from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload, subqueryload
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, joinedload, selectinload, subqueryload
 from sqlalchemy.sql import func
 
 from app.models.survey import Survey, SurveyVersion, Question, AnswerOption
@@ -125,47 +124,51 @@ class SurveyRepository:
             .order_by(SurveyVersion.version_number.desc())\
             .first()
 
-    def get_latest_published_versions_batch(self, survey_ids: List[int]) -> dict[int, SurveyVersion]:
+    def get_version_publish_states(self, version_ids: List[int]) -> dict[int, bool]:
+        """Map version_id -> is_published for the versions that exist."""
+        if not version_ids:
+            return {}
+
+        return dict(
+            self.db.query(SurveyVersion.id, SurveyVersion.is_published)
+            .filter(SurveyVersion.id.in_(version_ids))
+            .all()
+        )
+
+    def get_latest_published_version_ids(self, survey_ids: List[int]) -> dict[int, int]:
         """
-        Get latest PUBLISHED version for multiple surveys in a single query.
-        Returns a dict mapping survey_id -> SurveyVersion (avoids N+1).
+        Map survey_id -> id of its latest PUBLISHED version with one
+        DISTINCT ON query, without loading questions or options.
         """
         if not survey_ids:
             return {}
 
-        from sqlalchemy import func as sqla_func
-
-        # Subquery: max published version_number per survey
-        latest_sub = (
-            self.db.query(
-                SurveyVersion.survey_id,
-                sqla_func.max(SurveyVersion.version_number).label("max_vn"),
-            )
+        rows = (
+            self.db.query(SurveyVersion.survey_id, SurveyVersion.id)
             .filter(
                 SurveyVersion.survey_id.in_(survey_ids),
                 SurveyVersion.is_published == True,  # noqa: E712
             )
-            .group_by(SurveyVersion.survey_id)
-            .subquery()
+            .distinct(SurveyVersion.survey_id)
+            .order_by(SurveyVersion.survey_id, SurveyVersion.version_number.desc())
+            .all()
         )
+        return {r.survey_id: r.id for r in rows}
+
+    def get_versions_with_questions(self, version_ids: List[int]) -> List[SurveyVersion]:
+        """Load several versions with their questions and options (IN query per level)."""
+        if not version_ids:
+            return []
 
-        versions = (
+        return (
             self.db.query(SurveyVersion)
             .options(
-                joinedload(SurveyVersion.questions).joinedload(Question.options)
-            )
-            .join(
-                latest_sub,
-                and_(
-                    SurveyVersion.survey_id == latest_sub.c.survey_id,
-                    SurveyVersion.version_number == latest_sub.c.max_vn,
-                ),
+                selectinload(SurveyVersion.questions).selectinload(Question.options)
             )
+            .filter(SurveyVersion.id.in_(version_ids))
             .all()
         )
 
-        return {v.survey_id: v for v in versions}
-
     def publish_version(self, version_id: int) -> Optional[SurveyVersion]:
         """Publish a survey version."""
         version = self.get_version_by_id(version_id)
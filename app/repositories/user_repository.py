@@ -1,7 +1,7 @@
 """User repository."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, update
 from sqlalchemy.sql import func
 
 from app.models.user import User, UserRole
@@ -36,6 +36,30 @@ class UserRepository:
             .first()
         )
     
+    def rotate_token_version(
+        self, user_id: int, expected_version: Optional[int] = None
+    ) -> Optional[Tuple[int, UserRole]]:
+        """
+        Atomically increment token_version for a live, active user in a single
+        UPDATE ... RETURNING. When expected_version is given the row only
+        matches while it still holds that version, so two concurrent refreshes
+        of the same token cannot both succeed.
+
+        Returns (new_version, role), or None if nothing matched.
+        """
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.deleted_at == None, User.is_active == True)  # noqa: E711,E712
+            .values(token_version=User.token_version + 1)
+            .returning(User.token_version, User.role)
+            .execution_options(synchronize_session=False)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(User.token_version == expected_version)
+        row = self.db.execute(stmt).first()
+        self.db.commit()
+        return (row.token_version, row.role) if row else None
+
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email (excludes soft-deleted users)."""
         return (
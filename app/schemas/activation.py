@@ -1,7 +1,7 @@
 """Activation System Schemas"""
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import AliasChoices, BaseModel, EmailStr, Field, field_validator
 from enum import Enum
 
 
@@ -76,13 +76,19 @@ class WhitelistUpdate(BaseModel):
 
 
 class SupervisorInfo(BaseModel):
-    """Supervisor information"""
+    """Supervisor information (validates directly from a User via full_name)"""
     id: int
-    name: str
+    name: str = Field(validation_alias=AliasChoices("name", "full_name"))
+
+    model_config = {"from_attributes": True}
 
 
 class WhitelistResponse(BaseModel):
-    """Whitelist entry response"""
+    """Whitelist entry response.
+
+    Validated straight from a UserWhitelist row; created_by_name and
+    activated_user_name are model properties over eager-loaded relationships.
+    """
     id: int
     identifier: str
     identifier_type: IdentifierType
@@ -101,6 +107,15 @@ class WhitelistResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_entry(cls, entry: Any, active_code: Any = None) -> "WhitelistResponse":
+        """Build from a UserWhitelist, flagging the active code if one was found."""
+        response = cls.model_validate(entry)
+        if active_code is not None:
+            response.has_active_code = True
+            response.code_expires_at = active_code.expires_at
+        return response
+
 
 class WhitelistListResponse(BaseModel):
     """Paginated whitelist list response"""
@@ -1,5 +1,5 @@
 """Survey response schemas."""
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from typing import Optional, List, Dict, Any, Literal, Generic, TypeVar
 from datetime import datetime
 from enum import Enum
@@ -14,6 +14,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None  # pass back as `after` on keyset-paginated endpoints
 
 
 class QuestionAnswerCreate(BaseModel):
@@ -109,15 +110,34 @@ class DocumentMetadata(BaseModel):
     page_number: Optional[int] = None
 
 
+MAX_DOCUMENT_SIZE = 10 * 1024 * 1024  # 10MB
+
+
 class DocumentUploadRequest(BaseModel):
-    """Document upload request."""
+    """Document upload request (size and type limits enforced by the schema)."""
     client_id: str = Field(..., description="Response client_id this document belongs to")
     file_name: str
-    file_size: int
-    mime_type: str
+    file_size: int = Field(..., gt=0, le=MAX_DOCUMENT_SIZE, description="Bytes, 1 to 10MB")
+    mime_type: Literal["image/jpeg", "image/png", "application/pdf"]
     metadata: DocumentMetadata
 
 
+MAX_DOCUMENT_BATCH_SIZE = 50 * 1024 * 1024  # 50MB declared across one batch
+
+
+class BatchDocumentUploadRequest(BaseModel):
+    """Request upload URLs for several documents in one call."""
+    documents: List[DocumentUploadRequest] = Field(..., min_length=1, max_length=20)
+
+    @field_validator("documents")
+    @classmethod
+    def total_size_within_cap(cls, v: List[DocumentUploadRequest]) -> List[DocumentUploadRequest]:
+        """Cap the combined declared size of the batch"""
+        if sum(d.file_size for d in v) > MAX_DOCUMENT_BATCH_SIZE:
+            raise ValueError("Combined file_size of the batch exceeds 50MB")
+        return v
+
+
 class DocumentUploadResponse(BaseModel):
     """Document upload response — includes Cloudinary signed-upload params."""
     document_id: str
@@ -138,6 +158,7 @@ class SyncStatus(BaseModel):
     user_id: int
     pending_responses: int
     synced_responses: int
+    synced_responses_truncated: bool = False  # True when the count hit the server-side cap
     pending_documents: int
     last_sync: Optional[datetime] = None
     assigned_surveys: int
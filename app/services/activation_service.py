@@ -2,9 +2,9 @@
 import secrets
 import bcrypt
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func, or_
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy import and_, func, or_, text
 from fastapi import HTTPException, status
 
 from app.models.whitelist import UserWhitelist
@@ -37,6 +37,11 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _hour_floor(moment: datetime) -> datetime:
+    """Truncate to the hour, matching the view's date_trunc('hour', ...) buckets."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
 class ActivationCodeService:
     """Service for managing activation codes"""
 
@@ -106,10 +111,9 @@ class ActivationCodeService:
         )
 
         self.db.add(activation_code)
-        self.db.commit()
-        self.db.refresh(activation_code)
+        self.db.flush()  # Get code ID for the audit row
 
-        # Log code generation
+        # Log code generation (same transaction: one commit per event)
         audit_log = ActivationAuditLog(
             event_type="code_generated",
             activation_code_id=activation_code.id,
@@ -119,6 +123,7 @@ class ActivationCodeService:
         )
         self.db.add(audit_log)
         self.db.commit()
+        self.db.refresh(activation_code)
 
         # Send email if requested
         email_sent = False
@@ -152,23 +157,13 @@ class ActivationCodeService:
             email_status=email_status
         )
 
-    def list_activation_codes(
+    def _apply_code_filters(
         self,
-        page: int = 1,
-        limit: int = 20,
-        status_filter: Optional[str] = None,  # active, used, expired, locked
-        whitelist_id: Optional[int] = None,
-        sort_by: str = "generated_at",
-        sort_order: str = "desc"
-    ) -> ActivationCodeListResponse:
-        """List activation codes with filtering"""
-        query = self.db.query(ActivationCode).options(
-            joinedload(ActivationCode.whitelist_entry).joinedload(UserWhitelist.assigned_supervisor),
-            joinedload(ActivationCode.used_by_user),
-            joinedload(ActivationCode.generator)
-        )
-
-        # Apply filters
+        query,
+        status_filter: Optional[str],
+        whitelist_id: Optional[int]
+    ):
+        """Filters shared by list_activation_codes and get_list_fingerprint"""
         if status_filter:
             now = _now()
             if status_filter == "active":
@@ -198,6 +193,64 @@ class ActivationCodeService:
         if whitelist_id:
             query = query.filter(ActivationCode.whitelist_id == whitelist_id)
 
+        return query
+
+    def get_list_fingerprint(
+        self,
+        status_filter: Optional[str] = None,
+        whitelist_id: Optional[int] = None
+    ) -> Tuple[Any, ...]:
+        """
+        Cheap summary of everything list_activation_codes renders for these
+        filters: inserts/deletes, use, attempts/revocation (activation_attempts),
+        expiry, edits to the linked whitelist entries, and edits to the
+        supervisor, used-by and generator users (their full_name is rendered).
+        Used by the router to answer 304s.
+        """
+        supervisor = aliased(User)
+        used_by_user = aliased(User)
+        generator = aliased(User)
+        # Every join is to-one, so the code count and attempt sum are unchanged
+        return tuple(self._apply_code_filters(
+            self.db.query(
+                func.count(ActivationCode.id),
+                func.max(ActivationCode.generated_at),
+                func.max(ActivationCode.used_at),
+                func.max(ActivationCode.last_attempt_at),
+                func.sum(ActivationCode.activation_attempts),
+                func.count(ActivationCode.id).filter(ActivationCode.expires_at <= func.now()),
+                func.max(UserWhitelist.updated_at),
+                func.max(supervisor.updated_at),
+                func.max(used_by_user.updated_at),
+                func.max(generator.updated_at)
+            )
+            .select_from(ActivationCode)
+            .outerjoin(UserWhitelist, UserWhitelist.id == ActivationCode.whitelist_id)
+            .outerjoin(supervisor, supervisor.id == UserWhitelist.assigned_supervisor_id)
+            .outerjoin(used_by_user, used_by_user.id == ActivationCode.used_by_user_id)
+            .outerjoin(generator, generator.id == ActivationCode.generated_by),
+            status_filter, whitelist_id
+        ).one())
+
+    def list_activation_codes(
+        self,
+        page: int = 1,
+        limit: int = 20,
+        status_filter: Optional[str] = None,  # active, used, expired, locked
+        whitelist_id: Optional[int] = None,
+        sort_by: str = "generated_at",
+        sort_order: str = "desc"
+    ) -> ActivationCodeListResponse:
+        """List activation codes with filtering"""
+        query = self.db.query(ActivationCode).options(
+            joinedload(ActivationCode.whitelist_entry).joinedload(UserWhitelist.assigned_supervisor),
+            joinedload(ActivationCode.used_by_user),
+            joinedload(ActivationCode.generator)
+        )
+
+        # Apply filters
+        query = self._apply_code_filters(query, status_filter, whitelist_id)
+
         # Get total count
         total_items = query.count()
 
@@ -331,7 +384,6 @@ class ActivationCodeService:
             )
 
         code.expires_at = code.expires_at + timedelta(hours=additional_hours)
-        self.db.commit()
 
         audit_log = ActivationAuditLog(
             event_type="code_extended",
@@ -374,9 +426,8 @@ class ActivationCodeService:
                 detail="Whitelist entry does not use email identifier"
             )
 
-        # Revoke current code and generate a new one
+        # Revoke current code and generate a new one (single commit)
         code.activation_attempts = 999
-        self.db.commit()
 
         plain_code = self.generate_activation_code()
         code_hash = self.hash_activation_code(plain_code)
@@ -526,22 +577,34 @@ class ActivationCodeService:
         codes_generated_last_7 = self.db.query(ActivationCode).filter(
             ActivationCode.generated_at >= last_7_days
         ).count()
-        activations_last_7 = self.db.query(ActivationAuditLog).filter(
-            and_(ActivationAuditLog.event_type == "activation_success", ActivationAuditLog.created_at >= last_7_days)
-        ).count()
-        failed_attempts_24h = self.db.query(ActivationAuditLog).filter(
-            and_(ActivationAuditLog.success == False, ActivationAuditLog.created_at >= last_24_hours)
-        ).count()
 
-        failure_reasons = self.db.query(
-            ActivationAuditLog.failure_reason,
-            func.count(ActivationAuditLog.failure_reason)
-        ).filter(
-            ActivationAuditLog.failure_reason.isnot(None)
-        ).group_by(ActivationAuditLog.failure_reason).order_by(func.count(ActivationAuditLog.failure_reason).desc()).limit(5).all()
+        # Audit-log figures come from the hourly mv_activation_stats buckets,
+        # refreshed every 5 minutes by pg_cron or app.core.matviews
+        audit = self.db.execute(text("""
+            SELECT
+                coalesce(sum(total) FILTER (
+                    WHERE event_type = 'activation_success' AND bucket >= :since_7d
+                ), 0) AS activations_last_7,
+                coalesce(sum(total - ok) FILTER (WHERE bucket >= :since_24h), 0) AS failed_24h
+            FROM mv_activation_stats
+        """), {
+            "since_7d": _hour_floor(last_7_days),
+            "since_24h": _hour_floor(last_24_hours),
+        }).one()
+        activations_last_7 = int(audit.activations_last_7)
+        failed_attempts_24h = int(audit.failed_24h)
+
+        failure_reasons = self.db.execute(text("""
+            SELECT failure_reason, sum(total) AS count
+            FROM mv_activation_stats
+            WHERE failure_reason <> ''
+            GROUP BY failure_reason
+            ORDER BY count DESC
+            LIMIT 5
+        """)).all()
 
         top_failure_reasons = [
-            {"reason": reason, "count": count}
+            {"reason": reason, "count": int(count)}
             for reason, count in failure_reasons
         ]
 
@@ -584,9 +647,8 @@ class ActivationCodeService:
 
         # Mark as revoked
         code.activation_attempts = 999
-        self.db.commit()
 
-        # Log revocation
+        # Log revocation (committed together with the revocation)
         audit_log = ActivationAuditLog(
             event_type="code_revoked",
             activation_code_id=code.id,
@@ -818,10 +880,7 @@ class ActivationCodeService:
         whitelist.activated_at = _now()
         whitelist.activated_user_id = new_user.id
 
-        self.db.commit()
-        self.db.refresh(new_user)
-
-        # Log successful activation
+        # Log successful activation (committed together with the account)
         audit_log = ActivationAuditLog(
             event_type="activation_success",
             activation_code_id=matching_code.id,
@@ -835,6 +894,7 @@ class ActivationCodeService:
         )
         self.db.add(audit_log)
         self.db.commit()
+        self.db.refresh(new_user)
 
         # Generate access token (you'll need to import from auth)
         from app.core.security import create_access_token
@@ -1,5 +1,5 @@
 """Assignment service."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
@@ -134,17 +134,21 @@ class AssignmentService:
         
         return assignment
     
-    def delete_assignment(self, assignment_id: int) -> None:
+    def delete_assignment(self, assignment_id: int) -> Tuple[int, int, AssignmentStatus]:
         """
-        Delete assignment.
-        
+        Soft-delete assignment. Left uncommitted: the caller commits it
+        together with its audit row.
+
+        Returns (user_id, survey_id, previous status) for the audit log.
+
         Raises:
             HTTPException: If assignment not found
         """
-        success = self.assignment_repo.delete(assignment_id)
-        
-        if not success:
+        deleted = self.assignment_repo.delete(assignment_id)
+
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Assignment not found"
             )
+        return deleted
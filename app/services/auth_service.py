@@ -42,19 +42,17 @@ class AuthService:
         Raises:
             HTTPException: If authentication fails
         """
-        # First check if user exists
-        db_user = self.user_repo.get_by_email(email)
+        # Single lookup; the password is verified against this same row
+        user = self.user_repo.get_by_email(email)
         
         # Check if account is deactivated (before password check)
-        if db_user and not db_user.is_active:
+        if user and not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Tu cuenta está desactivada. Contacta al administrador.",
             )
         
-        user = self.authenticate_user(email, password)
-        
-        if not user:
+        if not user or not verify_password(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
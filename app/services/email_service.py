@@ -1,11 +1,7 @@
 """Email service using Resend."""
-import resend
 from typing import Optional, Dict, Any
 from app.core.config import settings
-
-
-# Configure Resend API
-resend.api_key = settings.RESEND_API_KEY
+from app.core.http import resend_client
 
 
 class EmailService:
@@ -182,8 +178,8 @@ Este es un correo automático, por favor no respondas.
 """
         
         try:
-            # Send email via Resend
-            response = resend.Emails.send({
+            # Send email via Resend's REST API on the shared pooled client
+            response = await resend_client.post("/emails", json={
                 "from": f"{settings.FROM_NAME} <{settings.FROM_EMAIL}>",
                 "to": [to_email],
                 "subject": subject,
@@ -194,10 +190,11 @@ Este es un correo automático, por favor no respondas.
                     {"name": "environment", "value": settings.ENVIRONMENT}
                 ]
             })
+            response.raise_for_status()
             
             return {
                 "success": True,
-                "email_id": response.get("id"),
+                "email_id": response.json().get("id"),
                 "status": "sent",
                 "message": "Email sent successfully"
             }
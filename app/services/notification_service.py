@@ -1,5 +1,5 @@
 """Notification service."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
@@ -71,6 +71,17 @@ class NotificationService:
     ) -> List[Notification]:
         return self.repo.get_all(skip=skip, limit=limit, unread_only=unread_only, user_id=user_id)
 
+    def get_notifications_with_unread_count(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        unread_only: bool = False,
+        user_id: Optional[int] = None,
+    ) -> Tuple[List[Notification], int]:
+        return self.repo.get_page_with_unread_count(
+            skip=skip, limit=limit, unread_only=unread_only, user_id=user_id
+        )
+
     def get_unread_count(self, user_id: Optional[int] = None) -> int:
         return self.repo.get_unread_count(user_id=user_id)
 
@@ -1,12 +1,15 @@
 """Survey response service."""
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.repositories.response_repository import ResponseRepository
 from app.repositories.survey_repository import SurveyRepository
+from app.models.assignment import Assignment
+from app.models.document import Document
 from app.models.response import SurveyResponse
 from app.schemas.response import (
     SurveyResponseCreate, 
@@ -16,6 +19,9 @@ from app.schemas.response import (
 )
 from app.core.ops_metrics import observe_batch_metrics
 
+# /mobile/sync-status stops counting a user's responses past this many
+SYNCED_RESPONSES_CAP = 500
+
 
 class ResponseService:
     """Survey response business logic."""
@@ -108,9 +114,10 @@ class ResponseService:
         return response
     
     def get_user_responses(self, user_id: int, skip: int = 0, 
-                          limit: int = 100) -> List[SurveyResponse]:
-        """Get all responses submitted by a user."""
-        return self.response_repo.get_by_user(user_id, skip=skip, limit=limit)
+                          limit: int = 100,
+                          after: Optional[Tuple[datetime, int]] = None) -> List[SurveyResponse]:
+        """Get responses submitted by a user, newest first (after: keyset cursor)."""
+        return self.response_repo.get_by_user(user_id, skip=skip, limit=limit, after=after)
 
     def count_user_responses(self, user_id: int) -> int:
         """Count total responses submitted by a user."""
@@ -127,27 +134,87 @@ class ResponseService:
         return self.response_repo.get_by_version(version_id, skip=skip, limit=limit)
 
     def get_sync_status(self, user_id: int) -> dict:
-        """Get sync status counters for a user."""
-        synced = len(self.response_repo.get_by_user(user_id, skip=0, limit=100000))
-        return {"synced_responses": synced}
+        """
+        Get sync status counters for a user: synced responses, last sync,
+        live assignments and pending documents, as scalar subqueries of a
+        single SELECT (one round trip, no rows loaded).
+
+        synced_responses is capped at SYNCED_RESPONSES_CAP (the count reads
+        at most cap + 1 index entries); synced_responses_truncated says so.
+        """
+        synced = (
+            select(SurveyResponse.id)
+            .where(SurveyResponse.user_id == user_id)
+            .limit(SYNCED_RESPONSES_CAP + 1)
+            .subquery()
+        )
+        row = self.db.execute(select(
+            select(func.count()).select_from(synced)
+            .scalar_subquery().label("synced_responses"),
+            select(func.max(SurveyResponse.synced_at))
+            .where(SurveyResponse.user_id == user_id)
+            .scalar_subquery().label("last_sync"),
+            select(func.count(Assignment.id))
+            .where(Assignment.user_id == user_id, Assignment.deleted_at == None)  # noqa: E711
+            .scalar_subquery().label("assigned_surveys"),
+            select(func.count(Document.id))
+            .where(Document.user_id == user_id, Document.status == "pending")
+            .scalar_subquery().label("pending_documents"),
+        )).one()
+        counters = dict(row._mapping)
+        counters["synced_responses_truncated"] = counters["synced_responses"] > SYNCED_RESPONSES_CAP
+        counters["synced_responses"] = min(counters["synced_responses"], SYNCED_RESPONSES_CAP)
+        return counters
+
+    def _insert_batch(
+        self, items: List[SurveyResponseCreate], user_id: int
+    ) -> Dict[str, int]:
+        """
+        Insert responses and their answers in two statements (no commit).
+        Returns client_id -> id of the responses that were new.
+        """
+        inserted = self.response_repo.insert_responses([
+            {
+                "user_id": user_id,
+                "version_id": item.version_id,
+                "client_id": item.client_id,
+                "started_at": item.started_at,
+                "completed_at": item.completed_at,
+                "location": item.location,
+                "device_info": item.device_info,
+            }
+            for item in items
+        ])
+        self.response_repo.insert_answers([
+            {
+                "response_id": inserted[item.client_id],
+                "question_id": answer.question_id,
+                "answer_value": answer.answer_value,
+                "media_url": answer.media_url,
+                "answered_at": answer.answered_at,
+            }
+            for item in items
+            if item.client_id in inserted
+            for answer in item.answers
+        ])
+        return inserted
 
     def submit_batch_responses(
         self, responses: List[SurveyResponseCreate], user_id: int
     ) -> BatchResponseResult:
         """
-        Submit multiple survey responses atomically with per-item savepoints.
+        Submit multiple survey responses with one commit.
 
-        Each response is protected by its own SAVEPOINT so a failure in one
-        item does not roll back the items that already succeeded.  The overall
-        transaction is committed once all items are processed.
+        Versions are checked in a single query and invalid items fail up
+        front. The rest go in with one INSERT ... ON CONFLICT (client_id)
+        DO NOTHING plus one batched answer insert; client_ids the database
+        skipped are DUPLICATE. If the bulk insert is rejected (e.g. an
+        unknown question_id), the items are retried under one SAVEPOINT
+        each so only the offending ones fail.
 
         Returns:
             BatchResponseResult with per-item ValidationStatus and summary counts.
         """
-        results: List[ResponseValidationResult] = []
-        synced = 0
-        failed_ids: List[str] = []
-
         def _contains_low_ocr_confidence(value: object) -> bool:
             if isinstance(value, dict):
                 conf = value.get("confidence")
@@ -172,57 +239,69 @@ class ResponseService:
             if any(_contains_low_ocr_confidence(a.answer_value) for a in response_data.answers):
                 low_ocr_count += 1
 
-        for i, response_data in enumerate(responses):
-            sp_name = f"sp_batch_{i}"
-            try:
-                # Check for duplicate before savepoint
-                if self.response_repo.exists_by_client_id(response_data.client_id):
-                    results.append(
-                        ResponseValidationResult(
-                            client_id=response_data.client_id,
-                            status=ValidationStatus.DUPLICATE,
-                            message="Response already synced (duplicate client_id)",
-                        )
-                    )
-                    synced += 1  # Duplicates count as successful
-                    continue
-
-                self.db.execute(text(f"SAVEPOINT {sp_name}"))
-                # Reuse single-item logic
-                self.submit_response(response_data, user_id)
-                self.db.execute(text(f"RELEASE SAVEPOINT {sp_name}"))
-                results.append(
-                    ResponseValidationResult(
-                        client_id=response_data.client_id,
-                        status=ValidationStatus.SYNCED,
-                        message="Synced successfully",
-                    )
-                )
-                synced += 1
-            except HTTPException as exc:
-                self.db.execute(text(f"ROLLBACK TO SAVEPOINT {sp_name}"))
-                results.append(
-                    ResponseValidationResult(
-                        client_id=response_data.client_id,
-                        status=ValidationStatus.FAILED,
-                        message=exc.detail,
-                    )
-                )
-                failed_ids.append(response_data.client_id)
-            except Exception as exc:  # noqa: BLE001
-                self.db.execute(text(f"ROLLBACK TO SAVEPOINT {sp_name}"))
-                results.append(
-                    ResponseValidationResult(
-                        client_id=response_data.client_id,
-                        status=ValidationStatus.FAILED,
-                        message=str(exc),
+        # Validate every item against one version lookup
+        published = self.survey_repo.get_version_publish_states(
+            list({r.version_id for r in responses})
+        )
+        errors: Dict[str, str] = {}
+        pending: List[SurveyResponseCreate] = []
+        seen_client_ids = set()
+        for response_data in responses:
+            if response_data.client_id in seen_client_ids:
+                continue  # repeated within the batch: reported as DUPLICATE
+            if response_data.version_id not in published:
+                errors[response_data.client_id] = "Survey version not found"
+            elif not published[response_data.version_id]:
+                errors[response_data.client_id] = "Cannot submit response to unpublished version"
+            else:
+                pending.append(response_data)
+            seen_client_ids.add(response_data.client_id)
+
+        try:
+            with self.db.begin_nested():
+                inserted = self._insert_batch(pending, user_id)
+        except SQLAlchemyError:
+            # Find the offending items: one SAVEPOINT per response
+            inserted = {}
+            for response_data in pending:
+                try:
+                    with self.db.begin_nested():
+                        inserted.update(self._insert_batch([response_data], user_id))
+                except SQLAlchemyError as exc:
+                    errors[response_data.client_id] = (
+                        f"Failed to submit response: {getattr(exc, 'orig', None) or exc}"
                     )
-                )
-                failed_ids.append(response_data.client_id)
 
-        # Commit all successful savepoints in one shot
+        # Commit all inserted responses in one shot
         self.db.commit()
 
+        results: List[ResponseValidationResult] = []
+        reported = set()
+        for response_data in responses:
+            client_id = response_data.client_id
+            if client_id in errors:
+                results.append(ResponseValidationResult(
+                    client_id=client_id,
+                    status=ValidationStatus.FAILED,
+                    message=errors[client_id],
+                ))
+            elif client_id in inserted and client_id not in reported:
+                results.append(ResponseValidationResult(
+                    client_id=client_id,
+                    status=ValidationStatus.SYNCED,
+                    message="Synced successfully",
+                ))
+            else:
+                results.append(ResponseValidationResult(
+                    client_id=client_id,
+                    status=ValidationStatus.DUPLICATE,
+                    message="Response already synced (duplicate client_id)",
+                ))
+            reported.add(client_id)
+
+        failed_ids = [r.client_id for r in results if r.status == ValidationStatus.FAILED]
+        synced = len(results) - len(failed_ids)  # Duplicates count as successful
+
         # Count duplicates (items that were already in DB)
         duplicates = sum(
             1 for r in results if r.status == ValidationStatus.DUPLICATE
@@ -231,6 +231,10 @@ class SurveyService:
         
         return latest
 
-    def get_latest_published_versions_batch(self, survey_ids: list[int]) -> dict[int, SurveyVersion]:
-        """Get latest published versions for multiple surveys in one query."""
-        return self.survey_repo.get_latest_published_versions_batch(survey_ids)
+    def get_latest_published_version_ids(self, survey_ids: list[int]) -> dict[int, int]:
+        """Map survey_id -> latest published version id (structure not loaded)."""
+        return self.survey_repo.get_latest_published_version_ids(survey_ids)
+
+    def get_versions_with_questions(self, version_ids: list[int]) -> list[SurveyVersion]:
+        """Load versions by id with their questions and options."""
+        return self.survey_repo.get_versions_with_questions(version_ids)
@@ -2,19 +2,19 @@
 import secrets
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, func
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
+from sqlalchemy import or_, and_, func, tuple_
 from fastapi import HTTPException, status
 
 from app.models.whitelist import UserWhitelist
 from app.models.activation_code import ActivationCode
 from app.models.user import User
+from app.api.pagination import decode_sort_cursor, encode_sort_cursor
 from app.schemas.activation import (
     WhitelistCreate,
     WhitelistUpdate,
     WhitelistResponse,
-    WhitelistListResponse,
-    SupervisorInfo
+    WhitelistListResponse
 )
 
 
@@ -93,32 +93,30 @@ class WhitelistService:
         return self.db.query(UserWhitelist).options(
             joinedload(UserWhitelist.assigned_supervisor),
             joinedload(UserWhitelist.activated_user),
-            joinedload(UserWhitelist.creator),
-            joinedload(UserWhitelist.activation_codes)
+            joinedload(UserWhitelist.creator)
         ).filter(UserWhitelist.id == whitelist_id).first()
 
-    def list_whitelist_entries(
-        self,
-        page: int = 1,
-        limit: int = 20,
-        status: Optional[str] = None,  # all, pending, activated
-        role: Optional[str] = None,
-        search: Optional[str] = None,
-        supervisor_id: Optional[int] = None,
-        sort_by: str = "created_at",
-        sort_order: str = "desc"
-    ) -> WhitelistListResponse:
+    def get_active_code(self, whitelist_id: int) -> Optional[ActivationCode]:
         """
-        List whitelist entries with filtering and pagination.
+        Get the latest-expiring usable code for an entry (ActivationCode.is_active:
+        not used, not expired, not locked/revoked) without loading the whole
+        activation_codes collection. Served by the ix_activation_codes_active
+        partial index.
         """
-        query = self.db.query(UserWhitelist).options(
-            joinedload(UserWhitelist.assigned_supervisor),
-            joinedload(UserWhitelist.activated_user),
-            joinedload(UserWhitelist.creator),
-            joinedload(UserWhitelist.activation_codes)
-        )
+        return self.db.query(ActivationCode).filter(
+            ActivationCode.whitelist_id == whitelist_id,
+            ActivationCode.is_active
+        ).order_by(ActivationCode.expires_at.desc()).limit(1).first()
 
-        # Apply filters
+    def _apply_list_filters(
+        self,
+        query,
+        status: Optional[str],
+        role: Optional[str],
+        search: Optional[str],
+        supervisor_id: Optional[int]
+    ):
+        """Filters shared by list_whitelist_entries and get_list_fingerprint"""
         if status == "pending":
             query = query.filter(UserWhitelist.is_activated == False)
         elif status == "activated":
@@ -139,75 +137,163 @@ class WhitelistService:
         if supervisor_id:
             query = query.filter(UserWhitelist.assigned_supervisor_id == supervisor_id)
 
-        # Get total count before pagination
-        total_items = query.count()
+        return query
+
+    def get_list_fingerprint(
+        self,
+        status: Optional[str] = None,
+        role: Optional[str] = None,
+        search: Optional[str] = None,
+        supervisor_id: Optional[int] = None
+    ) -> Tuple[Any, ...]:
+        """
+        Cheap summary of everything list_whitelist_entries renders for these
+        filters: entry edits/inserts/deletes, edits to the joined supervisor,
+        creator and activated users (their full_name is rendered), plus
+        activation-code state (which drives has_active_code). Used by the
+        router to answer 304s.
+        """
+        supervisor = aliased(User)
+        creator = aliased(User)
+        activated_user = aliased(User)
+        entries = self._apply_list_filters(
+            self.db.query(
+                func.max(UserWhitelist.updated_at),
+                func.count(UserWhitelist.id),
+                func.max(supervisor.updated_at),
+                func.max(creator.updated_at),
+                func.max(activated_user.updated_at)
+            )
+            .select_from(UserWhitelist)
+            .outerjoin(supervisor, supervisor.id == UserWhitelist.assigned_supervisor_id)
+            .outerjoin(creator, creator.id == UserWhitelist.created_by)
+            .outerjoin(activated_user, activated_user.id == UserWhitelist.activated_user_id),
+            status, role, search, supervisor_id
+        ).one()
+        codes = self.db.query(
+            func.count(ActivationCode.id),
+            func.max(ActivationCode.generated_at),
+            func.max(ActivationCode.used_at),
+            func.max(ActivationCode.last_attempt_at),
+            func.sum(ActivationCode.activation_attempts),
+            func.count(ActivationCode.id).filter(ActivationCode.expires_at <= func.now())
+        ).one()
+        return (*entries, *codes)
+
+    def list_whitelist_entries(
+        self,
+        page: int = 1,
+        limit: int = 20,
+        status: Optional[str] = None,  # all, pending, activated
+        role: Optional[str] = None,
+        search: Optional[str] = None,
+        supervisor_id: Optional[int] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        cursor: Optional[str] = None
+    ) -> WhitelistListResponse:
+        """
+        List whitelist entries with filtering and pagination.
+
+        Pass the previous page's ``next_cursor`` to seek past it on the
+        (sort column, id) index instead of scanning an OFFSET; ``page`` is
+        only used when no cursor is given. The total comes back with the rows
+        via ``count(*) OVER ()`` so each page is a single query.
+        """
+        query = self.db.query(
+            UserWhitelist,
+            func.count().over().label("total")
+        ).options(
+            joinedload(UserWhitelist.assigned_supervisor),
+            joinedload(UserWhitelist.activated_user),
+            joinedload(UserWhitelist.creator),
+            # A collection joinedload would multiply rows under LIMIT and the
+            # count(*) OVER () total; load the page's codes in one IN query
+            selectinload(UserWhitelist.activation_codes)
+        )
 
-        # Apply sorting
+        # Apply filters
+        query = self._apply_list_filters(query, status, role, search, supervisor_id)
+
+        # Apply sorting (id breaks ties so the keyset is total)
         if sort_by == "full_name":
             order_column = UserWhitelist.full_name
         elif sort_by == "identifier":
             order_column = UserWhitelist.identifier
         else:  # created_at
             order_column = UserWhitelist.created_at
+
+        keyset = tuple_(order_column, UserWhitelist.id)
+        if cursor:
+            cursor_value, cursor_id = decode_sort_cursor(cursor, sort_by)
+            boundary = tuple_(cursor_value, cursor_id)
+            query = query.filter(keyset > boundary if sort_order == "asc" else keyset < boundary)
         
         if sort_order == "asc":
-            query = query.order_by(order_column.asc())
+            query = query.order_by(order_column.asc(), UserWhitelist.id.asc())
         else:
-            query = query.order_by(order_column.desc())
+            query = query.order_by(order_column.desc(), UserWhitelist.id.desc())
 
         # Apply pagination
-        offset = (page - 1) * limit
-        entries = query.offset(offset).limit(limit).all()
+        if not cursor:
+            query = query.offset((page - 1) * limit)
+        rows = query.limit(limit).all()
 
-        # Calculate pagination info
-        total_pages = (total_items + limit - 1) // limit
-        has_next = page < total_pages
-        has_prev = page > 1
+        # The window is evaluated before OFFSET/LIMIT: total of the filtered set
+        # (or the rows remaining past the cursor in seek mode)
+        if rows:
+            total_items = rows[0].total
+        elif cursor:
+            total_items = 0  # nothing left past the cursor
+        else:
+            # A page past the end returns no row to carry the window total
+            total_items = self._apply_list_filters(
+                self.db.query(func.count(UserWhitelist.id)),
+                status, role, search, supervisor_id
+            ).scalar()
+        entries = [row.UserWhitelist for row in rows]
+
+        next_cursor = None
+        if cursor:
+            has_next = total_items > len(entries)
+            has_prev = True
+        else:
+            has_next = page * limit < total_items
+            has_prev = page > 1
+        if has_next and entries:
+            last = entries[-1]
+            next_cursor = encode_sort_cursor(sort_by, getattr(last, sort_by), last.id)
 
         # Convert to response format
         items = []
         for entry in entries:
-            # Check for active codes
-            has_active_code = False
-            code_expires_at = None
-            if entry.activation_codes:
-                for code in entry.activation_codes:
-                    if not code.is_used and not code.is_expired and not code.is_locked:
-                        has_active_code = True
-                        code_expires_at = code.expires_at
-                        break
-
-            items.append(WhitelistResponse(
-                id=entry.id,
-                identifier=entry.identifier,
-                identifier_type=entry.identifier_type,
-                full_name=entry.full_name,
-                phone=entry.phone,
-                assigned_role=entry.assigned_role,
-                assigned_supervisor=SupervisorInfo(
-                    id=entry.assigned_supervisor.id,
-                    name=entry.assigned_supervisor.full_name
-                ) if entry.assigned_supervisor else None,
-                is_activated=entry.is_activated,
-                has_active_code=has_active_code,
-                code_expires_at=code_expires_at,
-                activated_at=entry.activated_at,
-                activated_user_name=entry.activated_user.full_name if entry.activated_user else None,
-                created_at=entry.created_at,
-                created_by_name=entry.creator.full_name,
-                notes=entry.notes
-            ))
+            # Same pick as get_active_code: the latest-expiring usable code
+            active_code = max(
+                (code for code in entry.activation_codes if code.is_active),
+                key=lambda code: code.expires_at,
+                default=None
+            )
 
-        return WhitelistListResponse(
-            items=items,
-            pagination={
+            items.append(WhitelistResponse.from_entry(entry, active_code))
+
+        pagination = {
+            "limit": limit,
+            "has_next": has_next,
+            "has_prev": has_prev,
+            "next_cursor": next_cursor
+        }
+        if cursor:
+            pagination["remaining_items"] = total_items
+        else:
+            pagination.update({
                 "page": page,
-                "limit": limit,
                 "total_items": total_items,
-                "total_pages": total_pages,
-                "has_next": has_next,
-                "has_prev": has_prev
-            },
+                "total_pages": (total_items + limit - 1) // limit
+            })
+
+        return WhitelistListResponse(
+            items=items,
+            pagination=pagination,
             filters_applied={
                 "status": status or "all",
                 "role": role,